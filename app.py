@@ -1,6 +1,11 @@
+import atexit
 import sys
 import os
 
+from core.startup import StartupProfiler
+
+PROFILER = StartupProfiler()
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS  # PyInstaller temp folder
@@ -8,194 +13,270 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-import customtkinter as ctk
-from PIL import Image, ImageDraw, ImageFont
-import json
-import pygame
-from datetime import date
-
-from ui.theme import *
-from ui.components import Card, PixelButton, PixelLabel, PixelInput, PixelBadge
+with PROFILER.phase("import customtkinter"):
+    import customtkinter as ctk
+
+with PROFILER.phase("import app modules"):
+    from ui.theme import *
+    from ui.components import CanvasCard, CanvasBadge, PixelButton, PixelLabel, PixelInput
+    from ui.windows import WindowManager
+    from ui.pixel_text import PixelTextRenderer
+    from ui.assets import AssetLoader, AssetService
+    from ui.scheduler import TickScheduler, WakeupCounter
+    from ui.animation import Animator
+    from ui.staged import StagedBuilder
+    from ui.toast import ToastService
+    from ui.latency import LatencyMonitor
+    from core.journal import JournalStore
+    from core.writer import PersistenceWorker
+    from core.history import HistoryStore, format_day
+    from core.audio import AudioEngine
+    from core.timer import FocusTimer
+    from core.store import StateStore
+    from core.domain import PetalCore, load_state, PLANT_STAGES
+    from core.sessions import SessionLog
+    from core.rollups import Rollups
 
 
 STATE_FILE = "data/state.json"
+HISTORY_DB = "data/history.db"
+SESSION_LOG = "data/sessions.bin"
+ROLLUPS_FILE = "data/rollups.json"
+ASSET_CACHE_DIR = "data/cache"
+MUSIC_IDLE_RELEASE = 60   # seconds of silence before the audio device is closed
+MUSIC_FOCUS_ONLY = False  # True: music only plays during focus sessions
+ROLLOVER_CHECK_MAX = 3600  # seconds; re-check the date at least hourly (sleep, clock changes)
 ctk.set_appearance_mode("dark")  # Dark mode for pixel game aesthetic
+# CTk polls the OS theme every 30 ms and the DPI every 100 ms. The theme is
+# forced above, so that loop has nothing to do; a DPI change (window moved
+# to another monitor) is still picked up within a second
+ctk.AppearanceModeTracker.update_loop_interval = 60000
+ctk.ScalingTracker.update_loop_interval = 1000
+
+
+# Opt-in: PETAL_TRACE_LATENCY=1 or --trace-latency; must wrap Tk before any widget exists
+LATENCY = LatencyMonitor()
+# Exit diagnostics count every Tk wakeup, not only the tick scheduler's
+WAKEUPS = WakeupCounter() if PROFILER.enabled or LATENCY.enabled else None
+if WAKEUPS:
+    WAKEUPS.install()
+LATENCY.install()
 
 
 # ================= PIXEL TEXT HELPER =================
-def pixel_text(text, size, color=TITLE_GLOW):
-    font_path = resource_path("assets/fonts/PixelifySans.ttf")
-    font = ImageFont.truetype(font_path, size)
+PIXEL_TEXT = PixelTextRenderer(resource_path("assets/fonts/PixelifySans.ttf"))
 
-    dummy = Image.new("RGBA", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), text, font=font)
-    w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
 
-    img = Image.new("RGBA", (w + 10, h + 10), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Pixel glow effect
-    draw.text((5, 5), text, font=font, fill=SHADOW_COLOR)  # Shadow
-    draw.text((3, 3), text, font=font, fill=color)  # Main text
-    
-    return ctk.CTkImage(img, size=(w + 4, h + 4))
+def pixel_text(text, size, color=TITLE_GLOW):
+    return PIXEL_TEXT.render(text, size, color)
 
 
 class PetalApp(ctk.CTk):
     def __init__(self):
-        super().__init__()
-        self.geometry("650x980")
-        self.title("🌸 PetalOS")
-        self.configure(fg_color=BG)
+        PROFILER.mark("imports done")
+        with PROFILER.phase("create window"):
+            super().__init__()
+            self.geometry("650x980")
+            self.title("🌸 PetalOS")
+            self.configure(fg_color=BG)
+            self.scheduler = TickScheduler(self)
+            self.scheduler.counter = WAKEUPS
+            if LATENCY.enabled:
+                self.scheduler.tracer = LATENCY
+            self.animator = Animator(self.scheduler)
 
         # ---------- FONTS ----------
-        self.TITLE_FONT = ctk.CTkFont(family="Pixelify Sans", size=32, weight="bold")
-        self.BODY_FONT = ctk.CTkFont(family="Poppins", size=13)
-        self.SMALL_FONT = ctk.CTkFont(family="Poppins", size=11)
-        self.PIXEL_FONT = ctk.CTkFont(family="Pixelify Sans", size=14)
+        with PROFILER.phase("fonts"):
+            self.TITLE_FONT = ctk.CTkFont(family="Pixelify Sans", size=32, weight="bold")
+            self.BODY_FONT = ctk.CTkFont(family="Poppins", size=13)
+            self.SMALL_FONT = ctk.CTkFont(family="Poppins", size=11)
+            self.PIXEL_FONT = ctk.CTkFont(family="Pixelify Sans", size=14)
+
+        # Queued toasts on reusable widgets, stacked instead of overlapping
+        self.toasts = ToastService(self, self.scheduler, self.PIXEL_FONT)
 
         # ---------- MUSIC ----------
-        pygame.mixer.init()
+        # Mixer init and decoding happen on the audio thread, started
+        # after the first paint
         self.music_on = True
-        try:
-            pygame.mixer.music.load("assets/music/cutie-japan-lofi-402355.mp3")
-            pygame.mixer.music.set_volume(0.25)
-            pygame.mixer.music.play(-1)
-        except:
-            pass
+        self.audio = AudioEngine(
+            resource_path("assets/music"),
+            volume=0.25,
+            idle_release=MUSIC_IDLE_RELEASE,
+            focus_only=MUSIC_FOCUS_ONLY
+        )
 
         # ---------- TIMER ----------
-        self.remaining = 0
+        self.timer = FocusTimer()
         self.current_duration = 0
-        self.timer_running = False
-        self.timer_paused = False
-        self.timer_after_id = None
+        self.timer_shown = ("00:00", ACCENT_GREEN)  # what the label shows
 
         # ---------- DATA ----------
-        self.state = self.load_state()
-        self.images = self.load_images()
+        with PROFILER.phase("load state"):
+            self.store = JournalStore(STATE_FILE)
+            self.persist = PersistenceWorker(delay=0.5)
+            # Last resort for exits that bypass on_close; a no-op after it
+            atexit.register(self.persist.close)
+            self.history = HistoryStore(HISTORY_DB)
+            self.sessions = SessionLog(SESSION_LOG)
+            self.rollups = self.load_rollups()
+            self.windows = WindowManager()
+            # Bound widgets refresh once per event-loop turn after a change
+            self.state = StateStore(
+                self.load_state(),
+                schedule=lambda flush: self.scheduler.call_later(0, flush, key="state")
+            )
+            # Session, streak, garden and day rules; no Tk in there
+            self.core = PetalCore(
+                self.state, self.store, self.history, self.persist, self.sessions, self.rollups
+            )
+            # A day left open when the app was closed gets archived now;
+            # missed days reset the streak before it is shown
+            self.core.rollover()
+            self.core.update_streak()
+        with PROFILER.phase("request images"):
+            self.assets = AssetService(
+                self.scheduler,
+                AssetLoader(resource_path, cache_dir=ASSET_CACHE_DIR),
+                report=PROFILER.enabled
+            )
+            self.images = self.load_images()
 
         # ---------- UI ----------
-        self.build_ui()
-        self.refresh_garden()
+        with PROFILER.phase("build ui (above the fold)"):
+            self.build_ui()
+            self.bind_state()
+        LATENCY.attach_overlay(self, self.scheduler, self.SMALL_FONT)
+
+        self.closing = False
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Cmd+Q on macOS goes through ::tk::mac::Quit, not WM_DELETE_WINDOW
+        self.createcommand("::tk::mac::Quit", self.on_close)
+        PROFILER.mark("__init__ done")
+        self.after_idle(self.on_first_paint)
+
+    def on_first_paint(self):
+        PROFILER.mark("first paint")
+        with PROFILER.phase("start music"):
+            self.audio.start(muted=not self.music_on)
+        self.ui.start(on_done=self.on_interactive)
+        self.schedule_rollover()
+
+    def on_interactive(self):
+        # Every card exists now
+        PROFILER.mark("interactive")
+        PROFILER.report("first paint")
+
+    def on_close(self):
+        # Nothing queued for the disk may be lost when the window closes
+        if self.closing:
+            return
+        self.closing = True
+        self.stop_timer()
+        self.save_state()
+        self.audio.close()
+        # Diagnostics: printed when profiling, stored with the latency trace
+        diagnostics = [self.audio.cpu_report(), self.scheduler.report()]
+        if PROFILER.enabled or LATENCY.enabled:
+            print("\n".join(diagnostics))
+        LATENCY.export(diagnostics)
+        self.persist.close()
+        self.history.close()
+        self.sessions.flush()
+        self.assets.close()
+        self.destroy()
 
     # ================= ANIMATIONS =================
+    # All of these go through the shared frame loop in self.animator
     def pop_widget(self, widget):
-        try:
-            original_fg = widget.cget("fg_color")
-            widget.configure(fg_color=ACCENT_HOVER)
-            self.after(150, lambda: widget.configure(fg_color=original_fg))
-        except:
-            pass
+        self.animator.flash(widget, "fg_color", ACCENT_HOVER, 150)
     
-    def glow_widget(self, widget):
-        try:
-            widget.configure(text_color=ACCENT_YELLOW)
-            self.after(300, lambda: widget.configure(text_color=TEXT))
-        except:
-            pass
+    def glow_widget(self, widget, restore=TEXT):
+        self.animator.flash(widget, "text_color", ACCENT_YELLOW, 300, restore=restore)
 
     # ================= MUSIC =================
     def toggle_music(self):
         if self.music_on:
-            pygame.mixer.music.pause()
+            self.audio.pause()
             self.music_btn.configure(text="🔇")
         else:
-            pygame.mixer.music.unpause()
+            self.audio.resume()
             self.music_btn.configure(text="🔊")
         self.music_on = not self.music_on
 
     # ================= STATE =================
     def load_state(self):
-        try:
-            with open(STATE_FILE, "r") as f:
-                return json.load(f)
-        except:
-            # Default state
-            return {
-                "today_sessions": 0,
-                "streak": 0,
-                "mood": "",
-                "notes": "",
-                "main_task": "",
-                "task_done": False,
-                "plants": {"rose": 0, "hydrangea": 0, "sunflower": 0},
-                "history": [],
-                "last_active_date": ""
-            }
+        return load_state(self.store, self.history)
 
     def save_state(self):
-        with open(STATE_FILE, "w") as f:
-            json.dump(self.state, f, indent=2)
+        self.core.save()
+
+    def load_rollups(self):
+        rollups = Rollups(ROLLUPS_FILE)
+        # Fold in the history written before rollups, once. A store that
+        # already counts live sessions only gets the marker, or they would
+        # be counted twice
+        if not rollups.rebuilt:
+            if rollups.empty:
+                buckets = rollups.rebuild(self.history, self.sessions)
+                if PROFILER.enabled:
+                    print(f"[ROLLUPS] rebuilt {buckets} buckets from history")
+            else:
+                rollups.mark_rebuilt()
+            rollups.save()
+            rollups.flush()
+        return rollups
+
+    def bind_state(self):
+        """Widgets that follow the state: each refreshes only when its keys change."""
+        self.state.subscribe("today_sessions", lambda: self.session_badge.set_value(self.state["today_sessions"]))
+        self.state.subscribe("today_sessions", self.ui.only_if_built("progress", self.update_progress_flower))
+        self.state.subscribe("streak", lambda: self.streak_badge.set_value(self.state.get("streak", 0)))
+        self.state.subscribe("plants.*", self.ui.only_if_built("garden", self.refresh_garden))
+        self.state.subscribe("mood", self.ui.only_if_built("mood", self.update_mood_reaction))
 
     def update_streak(self):
-        today = str(date.today())
-        if self.state["today_sessions"] > 0:
-            if self.state.get("last_active_date") != today:
-                self.state["streak"] = self.state.get("streak", 0) + 1
-                self.state["last_active_date"] = today
-                self.show_toast(f"🔥 STREAK: {self.state['streak']} DAYS!", SUCCESS)
-        self.save_state()
-        self.update_stats_bar()
+        if self.core.update_streak():
+            self.show_toast(f"🔥 STREAK: {self.state['streak']} DAYS!", SUCCESS, priority=1)
 
     # ================= IMAGES =================
 
     def img(self, path, size):
-        """Load an image with error handling."""
-        try:
-            full_path = resource_path(path)
-            return ctk.CTkImage(
-                Image.open(full_path),
-                size=size
-            )
-        except FileNotFoundError:
-            print(f"[IMG NOT FOUND] {path}")
-            return None
-        except Exception as e:
-            print(f"[IMG LOAD FAILED] {path} -> {e}")
-            return None
+        """Placeholder image that fills in once decoded off the UI thread."""
+        return self.assets.image(path, size)
 
     def load_images(self):
-        """Load all application images."""
+        """Start loading the application images in the background."""
         imgs = {
             "moods": {},
-            "plants": {},
             "ui": {}  # You can add UI images here if needed
         }
 
-        # Load mood icons
         mood_names = ["sleepy", "motivated", "angry", "sad"]
-        for mood in mood_names:
-            img = self.img(f"assets/icons/{mood}.png", (48, 48))
-            if img:
-                imgs["moods"][mood.capitalize()] = img
-            else:
-                # Create a placeholder or use default
-                print(f"Warning: Could not load mood icon for {mood}")
-
-        # Load plant images
         plant_types = ["rose", "hydrangea", "sunflower"]
-        growth_stages = ["seed", "grow", "bloom"]
-
-        for plant in plant_types:
-            imgs["plants"][plant] = {}
-            for stage in growth_stages:
-                img_path = f"assets/plants/{plant}_{stage}.png"
-                img = self.img(img_path, (64, 64))
-                if img:
-                    imgs["plants"][plant][stage] = img
-                else:
-                    print(f"Warning: Could not load {plant} {stage} image")
-                    imgs["plants"][plant][stage] = None  # Explicitly set to None
+
+        # One decode of the cached sprite atlas instead of 13 PNGs
+        self.assets.start(
+            [(f"assets/icons/{mood}.png", (48, 48)) for mood in mood_names] +
+            [(f"assets/plants/{plant}_{stage}.png", (64, 64))
+             for plant in plant_types for stage in PLANT_STAGES]
+        )
+
+        # Mood icons are on the first screen: request them right away
+        for mood in mood_names:
+            imgs["moods"][mood.capitalize()] = self.img(f"assets/icons/{mood}.png", (48, 48))
 
         return imgs
 
+    def plant_img(self, plant, stage):
+        # Plant stages are only decoded once something shows them
+        return self.img(f"assets/plants/{plant}_{stage}.png", (64, 64))
+
     
     
     # ================= PROGRESS FLOWER =================
     def progress_flower_card(self, parent):
-        card = Card(parent, "Today's Growth")
+        card = CanvasCard(parent, "Today's Growth")
         
         content = ctk.CTkFrame(card.content_frame, fg_color="transparent")
         content.pack(pady=20, fill="x")
@@ -216,22 +297,22 @@ class PetalApp(ctk.CTk):
         sessions = self.state["today_sessions"]
 
         if sessions == 0:
-            img = self.images["plants"]["rose"]["seed"]
+            img = self.plant_img("rose", "seed")
             text = "PLANT A SEED"
             color = SUBTEXT
         elif sessions == 1:
-            img = self.images["plants"]["rose"]["grow"]
+            img = self.plant_img("rose", "grow")
             text = "GROWING... 🌱"
             color = ACCENT_GREEN
         else:
-            img = self.images["plants"]["rose"]["bloom"]
+            img = self.plant_img("rose", "bloom")
             text = "BLOOMING! 🌸"
             color = SUCCESS
 
         if img:
             self.progress_flower_label.configure(image=img)
         self.progress_text.configure(text=text, text_color=color)
-        self.glow_widget(self.progress_text)
+        self.glow_widget(self.progress_text, restore=color)
 
     # ================= UI =================
     def build_ui(self):
@@ -303,45 +384,32 @@ class PetalApp(ctk.CTk):
         reset_btn.pack(side="left", padx=15)
         reset_btn.bind("<Button-1>", lambda e: self.reset_today())
 
-        # Main content
+        # Main content: what fits in the window is built now, the rest
+        # after the first paint (placeholder heights are estimates)
         self.main_task_card(self.scroll)
         self.focus_card(self.scroll)
-        self.progress_flower_card(self.scroll)
-        self.mood_card(self.scroll)
-        self.notes_card(self.scroll)
-        self.garden_card(self.scroll)
-        self.end_day_card(self.scroll)
+
+        self.ui = StagedBuilder(self, self.scheduler, self.scroll)
+        self.ui.defer("progress", self.progress_flower_card, 260)
+        self.ui.defer("mood", self.mood_card, 420)
+        self.ui.defer("notes", self.notes_card, 270)
+        self.ui.defer("garden", self.garden_card, 230)
+        self.ui.defer("end_day", self.end_day_card, 130)
 
     # ================= STATS BAR =================
     def stats_bar(self, parent):
         bar = ctk.CTkFrame(parent, fg_color="transparent")
         bar.pack(fill="x", padx=20, pady=10)
         
-        self.session_badge = PixelBadge(bar, "⚡", self.state["today_sessions"], "SESSIONS")
+        self.session_badge = CanvasBadge(bar, "⚡", self.state["today_sessions"], "SESSIONS")
         self.session_badge.pack(side="left", padx=10)
         
-        self.streak_badge = PixelBadge(bar, "🔥", self.state.get("streak", 0), "STREAK")
+        self.streak_badge = CanvasBadge(bar, "🔥", self.state.get("streak", 0), "STREAK")
         self.streak_badge.pack(side="right", padx=10)
-    
-    def update_stats_bar(self):
-        # Update badges with current values
-        for widget in self.session_badge.winfo_children():
-            for child in widget.winfo_children():
-                if isinstance(child, ctk.CTkFrame):
-                    for label in child.winfo_children():
-                        if isinstance(label, ctk.CTkLabel) and label.cget("font")[1] == 16:
-                            label.configure(text=str(self.state["today_sessions"]))
-        
-        for widget in self.streak_badge.winfo_children():
-            for child in widget.winfo_children():
-                if isinstance(child, ctk.CTkFrame):
-                    for label in child.winfo_children():
-                        if isinstance(label, ctk.CTkLabel) and label.cget("font")[1] == 16:
-                            label.configure(text=str(self.state.get("streak", 0)))
 
     # ================= MAIN TASK =================
     def main_task_card(self, parent):
-        card = Card(parent, "Main Quest")
+        card = CanvasCard(parent, "Main Quest")
 
         content = ctk.CTkFrame(card.content_frame, fg_color="transparent")
         content.pack(padx=20, pady=15, fill="x")
@@ -370,14 +438,14 @@ class PetalApp(ctk.CTk):
     def toggle_task_done(self):
         if self.task_done_var.get():
             self.show_toast("⚔️ QUEST COMPLETE!", SUCCESS)
+            # Counted from the entry: main_task is only synced on save
+            self.core.complete_quest(self.task_entry.get())
             self.task_entry.delete(0, "end")
             self.task_done_var.set(False)
-            self.state["main_task"] = ""
-            self.save_state()
 
     # ================= TIMER =================
     def focus_card(self, parent):
-        card = Card(parent, "Focus Chamber")
+        card = CanvasCard(parent, "Focus Chamber")
 
         content = ctk.CTkFrame(card.content_frame, fg_color="transparent")
         content.pack(pady=20)
@@ -448,61 +516,93 @@ class PetalApp(ctk.CTk):
     def start_timer(self, minutes):
         self.stop_timer()
         self.current_duration = minutes
-        self.remaining = minutes * 60
-        self.timer_running = True
-        self.timer_paused = False
-        self.timer_label.configure(text_color=ACCENT_GREEN)
+        self.timer.start(minutes * 60)
+        self.core.start_session()
+        self.audio.set_focus(True)
+        self.pause_link.configure(text="⏸ PAUSE")
         self.update_timer()
 
+    def show_timer(self, text, color):
+        # Only touch the label when what it shows actually changes
+        shown_text, shown_color = self.timer_shown
+        changes = {}
+        if text != shown_text:
+            changes["text"] = text
+        if color != shown_color:
+            changes["text_color"] = color
+        if changes:
+            self.timer_label.configure(**changes)
+            self.timer_shown = (text, color)
+
     def update_timer(self):
-        if not self.timer_running:
+        if not self.timer.running or self.timer.paused:
             return
-        if not self.timer_paused:
-            mins, secs = divmod(self.remaining, 60)
-            self.timer_label.configure(text=f"{mins:02d}:{secs:02d}")
-            
-            # Color changes based on time
-            if self.remaining < 60:
-                self.timer_label.configure(text_color=ERROR)
-            elif self.remaining < 300:
-                self.timer_label.configure(text_color=WARNING)
-            
-            self.remaining -= 1
-            if self.remaining < 0:
-                self.complete_focus()
-                return
-        self.timer_after_id = self.after(1000, self.update_timer)
+
+        left = self.timer.seconds_left()
+        if left <= 0:
+            self.complete_focus()
+            return
+
+        # Color changes based on time
+        if left < 60:
+            color = ERROR
+        elif left < 300:
+            color = WARNING
+        else:
+            color = ACCENT_GREEN
+        mins, secs = divmod(left, 60)
+        self.show_timer(f"{mins:02d}:{secs:02d}", color)
+
+        # Wake up right when the displayed second changes, however late
+        # this callback ran. Minimized, the display may lag but the
+        # session still ends on time.
+        delay = int(self.timer.until_next_second() * 1000) + 1
+        self.scheduler.call_later(
+            delay,
+            self.update_timer,
+            key="timer",
+            throttle=True,
+            latest_ms=int(self.timer.remaining() * 1000) + 1
+        )
 
     def toggle_pause(self):
-        self.timer_paused = not self.timer_paused
+        if not self.timer.running:
+            return
+        if self.timer.paused:
+            self.timer.resume()
+            self.update_timer()
+        else:
+            self.timer.pause()
+            self.cancel_timer_tick()
         self.pause_link.configure(
-            text="▶ RESUME" if self.timer_paused else "⏸ PAUSE"
+            text="▶ RESUME" if self.timer.paused else "⏸ PAUSE"
         )
 
     def restart_timer(self):
         if self.current_duration:
             self.start_timer(self.current_duration)
 
-    def stop_timer(self):
-        self.timer_running = False
-        if self.timer_after_id:
-            self.after_cancel(self.timer_after_id)
-            self.timer_after_id = None
+    def cancel_timer_tick(self):
+        self.scheduler.cancel("timer")
+
+    def stop_timer(self, completed=False):
+        # Restarted, reset or cut off by End Day: still goes into the log
+        if self.timer.running:
+            self.core.log_session(self.timer, completed)
+        self.timer.stop()
+        self.audio.set_focus(False)
+        self.cancel_timer_tick()
 
     def complete_focus(self):
-        self.stop_timer()
-        self.timer_label.configure(text="DONE!", text_color=SUCCESS)
-        self.state["today_sessions"] += 1
-        self.grow_garden()
-        self.save_state()
-        self.refresh_garden()
-        self.update_progress_flower()
-        self.update_stats_bar()
+        self.stop_timer(completed=True)
+        self.show_timer("DONE!", SUCCESS)
+        self.core.complete_session()
         self.show_toast("⚡ +1 SESSION! GARDEN GREW!", SUCCESS)
+        self.update_streak()
 
     # ================= MOOD =================
     def mood_card(self, parent):
-        card = Card(parent, "Energy Check")
+        card = CanvasCard(parent, "Energy Check")
         
         content = ctk.CTkFrame(card.content_frame, fg_color="transparent")
         content.pack(pady=20)
@@ -546,21 +646,24 @@ class PetalApp(ctk.CTk):
             style="subtitle"
         )
         self.mood_reaction.pack(pady=15)
+        self.update_mood_reaction()
 
     def set_mood(self, mood):
         self.state["mood"] = mood
         self.save_state()
+
+    def update_mood_reaction(self):
         reactions = {
             "Sleepy": "☁️ START GENTLY",
             "Motivated": "🌱 HARNESS THIS ENERGY",
             "Angry": "🔥 CHANNEL IT INTO FOCUS",
             "Sad": "🤍 BE KIND TO YOURSELF"
         }
-        self.mood_reaction.configure(text=reactions[mood])
+        self.mood_reaction.configure(text=reactions.get(self.state["mood"], ""))
 
     # ================= NOTES =================
     def notes_card(self, parent):
-        card = Card(parent, "Field Notes")
+        card = CanvasCard(parent, "Field Notes")
 
         content = ctk.CTkFrame(card.content_frame, fg_color="transparent")
         content.pack(padx=20, pady=15, fill="x")
@@ -612,7 +715,7 @@ class PetalApp(ctk.CTk):
 
     # ================= GARDEN =================
     def garden_card(self, parent):
-        card = Card(parent, "Pixel Garden")
+        card = CanvasCard(parent, "Pixel Garden")
         
         content = ctk.CTkFrame(card.content_frame, fg_color="transparent")
         content.pack(pady=20)
@@ -621,6 +724,7 @@ class PetalApp(ctk.CTk):
         self.garden.pack(padx=20, pady=10)
 
         self.plant_labels = {}
+        self.plant_stages_shown = {}
         plants_frame = ctk.CTkFrame(self.garden, fg_color="transparent")
         plants_frame.pack(pady=20)
         
@@ -629,16 +733,16 @@ class PetalApp(ctk.CTk):
             lbl.pack(side="left", padx=25)
             self.plant_labels[plant] = lbl
 
-    def grow_garden(self):
-        for plant in self.state["plants"]:
-            if self.state["plants"][plant] < 2:
-                self.state["plants"][plant] += 1
-                break
+        self.refresh_garden()
 
     def refresh_garden(self):
         for plant, stage in self.state["plants"].items():
-            key = ["seed", "grow", "bloom"][stage]
-            img = self.images["plants"][plant][key]
+            # Only plants that actually changed get redrawn and popped
+            if self.plant_stages_shown.get(plant) == stage:
+                continue
+            self.plant_stages_shown[plant] = stage
+            key = PLANT_STAGES[stage]
+            img = self.plant_img(plant, key)
             if img:
                 lbl = self.plant_labels[plant]
                 lbl.configure(image=img)
@@ -646,45 +750,48 @@ class PetalApp(ctk.CTk):
 
     # ================= SAVE / RESET / HISTORY =================
     def save_today(self):
-        snapshot = {
-            "sessions": self.state["today_sessions"],
-            "mood": self.state["mood"],
-            "notes": self.state["notes"],
-            "task": self.state["main_task"],
-            "plants": self.state["plants"].copy()
-        }
-        self.state["history"].append(snapshot)
+        self.core.save_today()
+        self.windows.refresh("history")
         self.reset_today(False)
-        self.save_state()
-        self.update_progress_flower()
         self.show_toast("💾 DAY SAVED TO HISTORY", SUCCESS)
 
     def reset_today(self, show=True):
         self.stop_timer()
-        self.timer_label.configure(text="00:00", text_color=ACCENT_GREEN)
+        self.show_timer("00:00", ACCENT_GREEN)
+        self.clear_day_inputs()
+        self.core.reset_day()
 
-        self.state["today_sessions"] = 0
-        self.state["mood"] = ""
-        self.state["notes"] = ""
-        self.state["main_task"] = ""
-        self.state["task_done"] = False
+        if show:
+            self.show_toast("🔄 FRESH START", INFO)
 
+    def clear_day_inputs(self):
         self.task_entry.delete(0, "end")
         self.task_done_var.set(False)
-        self.notes.delete("1.0", "end")
+        if self.ui.built("notes"):
+            self.notes.delete("1.0", "end")
+
+    # ================= ROLLOVER =================
+    def schedule_rollover(self):
+        # Just past the next local midnight, or sooner to catch sleep/clock changes
+        delay = min(self.core.seconds_until_midnight() + 1, ROLLOVER_CHECK_MAX)
+        self.scheduler.call_later(int(delay * 1000), self.check_rollover, key="rollover")
+
+    def check_rollover(self):
+        # A running focus session keeps going and counts towards the new day;
+        # the archive and state writes happen on the persistence thread
+        if self.core.rollover():
+            self.clear_day_inputs()
+            self.windows.refresh("history")
+            self.show_toast("🌅 NEW DAY! YESTERDAY IS IN THE LOG", INFO)
+        self.schedule_rollover()
 
-        for p in self.state["plants"]:
-            self.state["plants"][p] = 0
-
-        self.save_state()
-        self.refresh_garden()
-        self.update_progress_flower()
-        self.update_stats_bar()
+    def show_history(self):
+        self.windows.show("history", self._build_history_window, self._update_history_window)
 
-        if show:
-            self.show_toast("🔄 FRESH START", INFO)
+    def _build_history_window(self):
+        # Only needed once the log is opened
+        from ui.history_list import VirtualList
 
-    def show_history(self):
         win = ctk.CTkToplevel(self)
         win.title("📖 History Log")
         win.geometry("450x550")
@@ -696,38 +803,41 @@ class PetalApp(ctk.CTk):
         
         PixelLabel(header, "📖 QUEST LOG", style="title").pack(pady=20)
 
-        frame = ctk.CTkScrollableFrame(win, fg_color=BG)
-        frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        win.summary_label = PixelLabel(header, "", style="subtitle")
+        win.empty_label = PixelLabel(win, "NO ENTRIES YET 🌸", style="subtitle")
+
+        # Only the rows on screen get widgets; pages load while scrolling
+        win.day_list = VirtualList(
+            win,
+            count=0,
+            fetch=self.history.page,
+            render=lambda i, day: format_day(i + 1, day),
+            font=self.BODY_FONT
+        )
+        return win
 
-        if not self.state["history"]:
-            PixelLabel(frame, "NO ENTRIES YET 🌸", style="subtitle").pack(pady=40)
+    def _update_history_window(self, win):
+        summary = self.history.summary()
+        if not summary["days"]:
+            win.empty_label.pack(pady=40)
             return
 
-        for i, day in enumerate(self.state["history"], 1):
-            day_card = ctk.CTkFrame(frame, fg_color=CARD_BG, corner_radius=0, border_width=2, border_color=PIXEL_BORDER)
-            day_card.pack(fill="x", pady=8)
-            
-            day_content = ctk.CTkFrame(day_card, fg_color="transparent")
-            day_content.pack(padx=15, pady=15, fill="x")
-            
-            PixelLabel(day_content, f"▸ DAY {i}", style="title").pack(anchor="w")
-            
-            info_text = f"""⚡ {day['sessions']} sessions
-🎭 Mood: {day['mood'] or 'Not set'}
-⚔️ Quest: {day['task'] or 'None'}
-📝 {day['notes'][:50]}{'...' if len(day['notes']) > 50 else ''}"""
-            
-            ctk.CTkLabel(
-                day_content,
-                text=info_text,
-                justify="left",
-                text_color=TEXT,
-                font=self.BODY_FONT
-            ).pack(anchor="w", pady=(10, 0))
+        win.empty_label.pack_forget()
+        week = self.rollups.get("week")
+        win.summary_label.configure(
+            text=f"{summary['days']} DAYS • {summary['sessions']} SESSIONS\n"
+                 f"THIS WEEK: {week['sessions']} SESSIONS • {round(week['focus_minutes'])} MIN"
+        )
+        win.summary_label.pack(pady=(0, 15))
+        win.day_list.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+
+        # Rows already rendered stay as they are; only new days get drawn
+        if summary["days"] != win.day_list.count:
+            win.day_list.set_count(summary["days"])
 
     # ================= END DAY =================
     def end_day_card(self, parent):
-        card = Card(parent, "Day's End")
+        card = CanvasCard(parent, "Day's End")
         
         content = ctk.CTkFrame(card.content_frame, fg_color="transparent")
         content.pack(pady=20)
@@ -742,38 +852,20 @@ class PetalApp(ctk.CTk):
 
     def end_day(self):
         self.stop_timer()
-        self.timer_label.configure(text="00:00", text_color=ACCENT_GREEN)
+        self.show_timer("00:00", ACCENT_GREEN)
         self.save_today()
         self.update_streak()
         self.show_popup("🌙 REST WELL", "You showed up today. That's what matters. 🌸")
 
     # ================= HELPERS =================
-    def show_toast(self, text, color=ACCENT):
-        toast_frame = ctk.CTkFrame(
-            self,
-            fg_color=PIXEL_BORDER,
-            corner_radius=0,
-            border_width=3,
-            border_color=color
-        )
-        toast_frame.place(relx=0.5, rely=0.92, anchor="center")
-        
-        toast_inner = ctk.CTkFrame(toast_frame, fg_color=CARD_BG, corner_radius=0)
-        toast_inner.pack(padx=3, pady=3)
-        
-        toast = ctk.CTkLabel(
-            toast_inner,
-            text=text,
-            font=self.PIXEL_FONT,
-            text_color=color
-        )
-        toast.pack(padx=25, pady=12)
-        
-        self.after(2000, toast_frame.destroy)
+    def show_toast(self, text, color=ACCENT, priority=0):
+        self.toasts.show(text, color, priority)
 
     def show_popup(self, title, text):
+        self.windows.show("popup", self._build_popup, self._update_popup, title, text)
+
+    def _build_popup(self):
         win = ctk.CTkToplevel(self)
-        win.title(title)
         win.geometry("420x280")
         win.configure(fg_color=BG)
         
@@ -786,30 +878,35 @@ class PetalApp(ctk.CTk):
         )
         content.pack(fill="both", expand=True, padx=20, pady=20)
         
-        PixelLabel(content, title, style="title").pack(pady=(30, 20))
+        win.title_label = PixelLabel(content, "", style="title")
+        win.title_label.pack(pady=(30, 20))
         
-        ctk.CTkLabel(
+        win.text_label = ctk.CTkLabel(
             content,
-            text=text,
+            text="",
             font=self.BODY_FONT,
             justify="center",
             wraplength=340,
             text_color=TEXT
-        ).pack(padx=30, pady=(0, 20))
+        )
+        win.text_label.pack(padx=30, pady=(0, 20))
         
+        # Hidden, not destroyed: the next popup reuses this window
         PixelButton(
             content,
             text="OK",
             color=ACCENT,
-            command=win.destroy
+            command=win.withdraw
         ).pack(pady=(10, 30))
+        return win
+
+    def _update_popup(self, win, title, text):
+        win.title(title)
+        win.title_label.configure(text=title)
+        win.text_label.configure(text=text)
 
     def soft_pulse(self, widget):
-        try:
-            widget.configure(text_color=ACCENT_YELLOW)
-            self.after(200, lambda: widget.configure(text_color=TEXT))
-        except:
-            pass
+        self.animator.flash(widget, "text_color", ACCENT_YELLOW, 200, restore=TEXT)
 
 
 if __name__ == "__main__":
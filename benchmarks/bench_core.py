@@ -0,0 +1,205 @@
+"""Benchmarks for the Tk-free core on synthetic 1, 5 and 10 year histories.
+
+    python benchmarks/bench_core.py                     # check the budgets
+    python benchmarks/bench_core.py --save-baseline     # store this machine's numbers
+    python benchmarks/bench_core.py --baseline benchmarks/baseline.json
+
+Exits with status 1 when an operation's median is over its budget, or
+(with a baseline) more than --tolerance slower than the baseline.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.domain import DEFAULT_STATE, PetalCore, load_state
+from core.history import HistoryStore, format_day
+from core.journal import JournalStore
+from core.rollups import Rollups
+from core.store import StateStore
+
+
+YEARS = (1, 5, 10)
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Median ms per call, whatever the history size
+BUDGETS = {
+    "load_state": 50,
+    "save_state": 15,
+    "save_today": 30,
+    "update_streak": 15,
+    "render_history": 30,
+}
+
+MOODS = ["", "Sleepy", "Motivated", "Angry", "Sad"]
+WORDS = "water the roses finish report call mom read two chapters stretch plan week".split()
+
+
+# ================= SYNTHETIC DATA =================
+def synthetic_day(rng, day):
+    return {
+        "date": str(day),
+        "sessions": rng.randint(0, 12),
+        "mood": rng.choice(MOODS),
+        "task": " ".join(rng.choices(WORDS, k=rng.randint(0, 5))),
+        "notes": " ".join(rng.choices(WORDS, k=rng.randint(0, 40))),
+        "plants": {plant: rng.randint(0, 2) for plant in DEFAULT_STATE["plants"]},
+    }
+
+
+def build(directory, years):
+    """State snapshot, a partly filled journal and ``years`` of history."""
+    rng = random.Random(years)
+    today = date.today()
+    days = years * 365
+
+    history = HistoryStore(os.path.join(directory, "history.db"))
+    history.import_legacy(synthetic_day(rng, today - timedelta(days=days - i)) for i in range(days))
+
+    store = JournalStore(os.path.join(directory, "state.json"))
+    state = StateStore(load_state(store, history))
+    history.close()
+    state["streak"] = rng.randint(0, days)
+    state["last_active_date"] = str(today - timedelta(days=1))
+    store.save(state)
+    store.flush()
+    store.compact()
+
+    # A day's worth of edits not compacted yet
+    for i in range(150):
+        state["notes"] = " ".join(rng.choices(WORDS, k=i % 40))
+        state["today_sessions"] = i % 12
+        store.save(state, state.take_unsaved())
+        store.flush()
+
+
+def open_core(directory):
+    history = HistoryStore(os.path.join(directory, "history.db"))
+    store = JournalStore(os.path.join(directory, "state.json"))
+    state = StateStore(load_state(store, history))
+    rollups = Rollups(os.path.join(directory, "rollups.json"))
+    rollups.rebuild(history)
+    rollups.save()
+    rollups.flush()
+    return PetalCore(state, store, history, rollups=rollups)
+
+
+# ================= OPERATIONS =================
+def bench_load_state(directory, core, i):
+    store = JournalStore(os.path.join(directory, "state.json"))
+    load_state(store, core.history)
+
+
+def bench_save_state(directory, core, i):
+    core.state["notes"] = f"benchmark note {i}"
+    core.save()
+
+
+def bench_save_today(directory, core, i):
+    core.state["today_sessions"] = 3
+    core.state["mood"] = "Motivated"
+    core.save_today()
+
+
+def bench_update_streak(directory, core, i):
+    core.state["today_sessions"] = 1
+    core.state["last_active_date"] = ""
+    core.update_streak()
+
+
+def bench_render_history(directory, core, i):
+    # What the quest log does on open: the header, then the first and last page
+    summary = core.history.summary()
+    for offset in (0, max(0, summary["days"] - 50)):
+        for n, day in enumerate(core.history.page(offset, 50)):
+            format_day(offset + n + 1, day)
+
+
+OPERATIONS = {
+    "load_state": bench_load_state,
+    "save_state": bench_save_state,
+    "save_today": bench_save_today,
+    "update_streak": bench_update_streak,
+    "render_history": bench_render_history,
+}
+
+
+def measure(fn, directory, core, repeat):
+    times = []
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        fn(directory, core, i)
+        times.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(times)
+
+
+def run(repeat):
+    results = {}
+    for years in YEARS:
+        with tempfile.TemporaryDirectory(prefix="petal-bench-") as directory:
+            t0 = time.perf_counter()
+            build(directory, years)
+            print(f"[BENCH] {years}y: generated {years * 365} days in {time.perf_counter() - t0:.1f} s")
+            core = open_core(directory)
+            results[f"{years}y"] = {
+                name: round(measure(fn, directory, core, repeat), 3)
+                for name, fn in OPERATIONS.items()
+            }
+            core.history.close()
+    return results
+
+
+# ================= CHECKS =================
+def check(results, baseline, tolerance):
+    failures = []
+    print(f"[BENCH] {'operation':<16}" + "".join(f"{size:>10}" for size in results))
+    for name in OPERATIONS:
+        row = f"[BENCH] {name:<16}"
+        for size, ops in results.items():
+            ms = ops[name]
+            row += f"{ms:>10.2f}"
+            if ms > BUDGETS[name]:
+                failures.append(f"{name} @ {size}: {ms:.2f} ms, budget {BUDGETS[name]} ms")
+            before = baseline.get(size, {}).get(name)
+            # Sub-millisecond differences are noise, not regressions
+            if before is not None and ms > before * (1 + tolerance) and ms - before > 1:
+                failures.append(f"{name} @ {size}: {ms:.2f} ms, baseline {before:.2f} ms")
+        print(row)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--save-baseline", nargs="?", const=BASELINE_FILE, metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+
+    results = run(args.repeat)
+    failures = check(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"[BENCH] baseline written to {args.save_baseline}")
+
+    for failure in failures:
+        print(f"[BENCH FAILED] {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
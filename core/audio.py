@@ -0,0 +1,225 @@
+import io
+import os
+import queue
+import threading
+import time
+
+
+class AudioEngine:
+    """Background music on its own thread.
+
+    The thread imports pygame, opens the mixer and plays every track in
+    ``music_dir`` as a playlist. The upcoming track is read into memory
+    and handed to ``pygame.mixer.music.queue`` while the current one is
+    still playing, so SDL_mixer switches over without a gap. Fades are
+    volume ramps run on the same thread; the Tk side only posts commands.
+
+    Power: once the music has been silent for ``idle_release`` seconds
+    (muted, or no focus session running when ``focus_only`` is set) the
+    mixer is shut down entirely, closing the audio device and SDL's
+    mixing thread. It is reopened on demand and resumes the same track
+    at the same position.
+    """
+
+    POLL = 0.1        # seconds between playlist checks
+    FADE_STEP = 0.02  # seconds between volume steps
+
+    def __init__(self, music_dir, volume=0.25, fade_ms=1200, idle_release=60, focus_only=False):
+        self.music_dir = music_dir
+        self.volume = volume
+        self.fade_ms = fade_ms
+        self.idle_release = idle_release
+        self.focus_only = focus_only
+        self.playlist = sorted(
+            os.path.join(music_dir, name)
+            for name in os.listdir(music_dir)
+            if name.lower().endswith((".mp3", ".ogg", ".wav"))
+        ) if os.path.isdir(music_dir) else []
+
+        self.index = 0
+        self.playing = False
+        self.muted = False
+        self.focus_active = False
+        self._pygame = None
+        self._mixer_open = False
+        self._started = False       # a track has been loaded since the mixer opened
+        self._start_offset = 0.0    # seconds into the track where play() started
+        self._last_pos = 0
+        self._silent_since = None
+        self._commands = queue.SimpleQueue()
+        self._thread = None
+
+        # CPU used by the whole process while the mixer is open vs released
+        self._cpu = {"open": [0.0, 0.0], "released": [0.0, 0.0]}
+        self._cpu_mark = (time.process_time(), time.monotonic())
+
+    # ================= TK SIDE =================
+    def start(self, muted=False):
+        if self._thread or not self.playlist:
+            return
+        self.muted = muted
+        self._thread = threading.Thread(target=self._run, name="petal-audio", daemon=True)
+        self._thread.start()
+
+    def pause(self):
+        self._commands.put(("muted", True))
+
+    def resume(self):
+        self._commands.put(("muted", False))
+
+    def set_focus(self, active):
+        self._commands.put(("focus", active))
+
+    def close(self, timeout=2):
+        if self._thread:
+            self._commands.put(("stop", None))
+            self._thread.join(timeout)
+        self._account_cpu()
+
+    def cpu_report(self):
+        self._account_cpu()
+        lines = []
+        for state, (cpu, wall) in self._cpu.items():
+            share = cpu / wall * 100 if wall else 0
+            lines.append(f"mixer {state}: {cpu:.1f} s CPU in {wall:.0f} s ({share:.1f}%)")
+        return "[AUDIO] " + "; ".join(lines)
+
+    # ================= AUDIO THREAD =================
+    def _wanted(self):
+        return not self.muted and (self.focus_active or not self.focus_only)
+
+    def _run(self):
+        try:
+            import pygame
+            self._pygame = pygame
+        except Exception as e:
+            print(f"[MUSIC FAILED] {e}")
+            return
+
+        while True:
+            try:
+                name, value = self._commands.get(timeout=self.POLL)
+            except queue.Empty:
+                name = None
+
+            try:
+                if name == "stop":
+                    if self.playing:
+                        self._fade(self.volume, 0, self.fade_ms // 3)
+                    self._release()
+                    return
+                if name == "muted":
+                    self.muted = value
+                elif name == "focus":
+                    self.focus_active = value
+
+                self._reconcile()
+                if self.playing:
+                    self._check_track_change()
+            except Exception as e:
+                print(f"[MUSIC FAILED] {e}")
+
+    def _reconcile(self):
+        if self._wanted() and not self.playing:
+            self._silent_since = None
+            if not self._mixer_open:
+                self._open()
+            if self._started:
+                self._mixer.music.unpause()
+                self.playing = True
+                self._fade(0, self.volume, self.fade_ms)
+            else:
+                self._play(self.index, self._start_offset)
+        elif not self._wanted() and self.playing:
+            self._fade(self.volume, 0, self.fade_ms)
+            self._mixer.music.pause()
+            self.playing = False
+            self._silent_since = time.monotonic()
+        elif not self.playing and self._mixer_open:
+            if self._silent_since is None:
+                self._silent_since = time.monotonic()
+            elif time.monotonic() - self._silent_since >= self.idle_release:
+                self._release()
+
+    # ================= MIXER LIFETIME =================
+    @property
+    def _mixer(self):
+        return self._pygame.mixer
+
+    def _open(self):
+        self._account_cpu()
+        self._mixer.init()
+        self._mixer_open = True
+        self._started = False
+
+    def _release(self):
+        """Close the audio device, remembering where playback was."""
+        if not self._mixer_open:
+            return
+        if self._started:
+            self._start_offset = self._position()
+        self._account_cpu()
+        self._mixer.quit()
+        self._mixer_open = False
+        self._started = False
+        self.playing = False
+        self._silent_since = None
+
+    def _position(self):
+        pos = self._mixer.music.get_pos()
+        return self._start_offset + max(pos, 0) / 1000
+
+    def _account_cpu(self):
+        cpu, wall = time.process_time(), time.monotonic()
+        bucket = self._cpu["open" if self._mixer_open else "released"]
+        bucket[0] += cpu - self._cpu_mark[0]
+        bucket[1] += wall - self._cpu_mark[1]
+        self._cpu_mark = (cpu, wall)
+
+    # ================= PLAYLIST =================
+    @staticmethod
+    def _prefetch(path):
+        # Reading the whole file now keeps disk I/O out of the switch-over
+        with open(path, "rb") as f:
+            return io.BytesIO(f.read())
+
+    def _play(self, index, start=0.0):
+        path = self.playlist[index]
+        music = self._mixer.music
+        music.load(self._prefetch(path), os.path.splitext(path)[1][1:])
+        music.set_volume(0)
+        try:
+            music.play(start=start)
+        except Exception:
+            start = 0.0  # format without seeking support
+            music.play()
+        self._started = True
+        self.playing = True
+        self._start_offset = start
+        self._last_pos = 0
+        self._queue_next()
+        self._fade(0, self.volume, self.fade_ms)
+
+    def _queue_next(self):
+        path = self.playlist[(self.index + 1) % len(self.playlist)]
+        self._mixer.music.queue(self._prefetch(path), os.path.splitext(path)[1][1:])
+
+    def _check_track_change(self):
+        # get_pos() restarts from 0 when the queued track takes over
+        pos = self._mixer.music.get_pos()
+        if pos < self._last_pos:
+            self.index = (self.index + 1) % len(self.playlist)
+            self._start_offset = 0.0
+            self._queue_next()
+        elif not self._mixer.music.get_busy():
+            # Queue ran dry (e.g. a track failed to decode): restart cleanly
+            self.index = (self.index + 1) % len(self.playlist)
+            self._play(self.index)
+            return
+        self._last_pos = pos
+
+    def _fade(self, start, end, ms):
+        steps = max(1, int(ms / 1000 / self.FADE_STEP))
+        for step in range(1, steps + 1):
+            self._mixer.music.set_volume(start + (end - start) * step / steps)
+            time.sleep(self.FADE_STEP)
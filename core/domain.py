@@ -0,0 +1,234 @@
+import copy
+from datetime import date, datetime, time, timedelta
+
+from core.streak import StreakIndex
+
+
+DEFAULT_STATE = {
+    "today_sessions": 0,
+    "streak": 0,
+    "mood": "",
+    "notes": "",
+    "main_task": "",
+    "task_done": False,
+    "plants": {"rose": 0, "hydrangea": 0, "sunflower": 0},
+    "last_active_date": "",
+    "longest_streak": 0,
+    "day": ""  # date the live day belongs to, for the midnight rollover
+}
+
+PLANT_STAGES = ("seed", "grow", "bloom")
+
+
+def load_state(store, history):
+    """Snapshot + journal replay; missing keys fall back to the defaults."""
+    state = store.load(copy.deepcopy(DEFAULT_STATE))
+
+    # Older versions kept every day inside state.json; move them to SQLite
+    legacy = state.pop("history", None)
+    if legacy:
+        history.import_legacy(legacy)
+    if legacy is not None:
+        store.save(state)
+        store.flush()
+        # Rewrite the snapshot now, or every start keeps parsing the old days
+        store.compact()
+    return state
+
+
+class PetalCore:
+    """Session, streak, garden and day-snapshot rules, without any Tk.
+
+    ``state`` is the app's StateStore, ``store`` the JournalStore it is
+    saved to, ``history`` the HistoryStore; ``sessions`` (SessionLog) and
+    ``rollups`` (Rollups) are optional. Disk writes go through
+    ``persist.request`` (the PersistenceWorker); with ``persist=None``
+    they run inline, which is what the benchmarks use.
+
+    Day boundaries are taken in ``tz`` (the system zone when None).
+    """
+
+    def __init__(self, state, store, history, persist=None, sessions=None, rollups=None, tz=None):
+        self.state = state
+        self.store = store
+        self.history = history
+        self.persist = persist
+        self.sessions = sessions
+        self.rollups = rollups
+        self.tz = tz
+        self._mood_at_start = ""
+        self.streaks = self._load_streaks()
+
+    def today(self):
+        return datetime.now(self.tz).date()
+
+    def _load_streaks(self):
+        days = []
+        for value in self.history.active_dates():
+            try:
+                days.append(date.fromisoformat(value or ""))
+            except ValueError:
+                pass
+        # The stored streak is the run ending at last_active_date. Legacy
+        # history rows have no date, so this is the only record of it
+        try:
+            last = date.fromisoformat(self.state.get("last_active_date") or "")
+        except ValueError:
+            last = None
+        if last is not None:
+            run = max(1, self.state.get("streak", 0))
+            days.extend(last - timedelta(days=i) for i in range(run))
+        return StreakIndex(days)
+
+    def _write(self, job):
+        if self.persist:
+            self.persist.request(job)
+        else:
+            job()
+
+    # ================= STATE =================
+    def save(self):
+        # Only the keys the state store marked dirty are journaled; the
+        # disk write happens on the persistence thread, once per burst
+        keys = self.state.take_unsaved()
+        if keys and self.store.save(self.state, keys):
+            self._write(self.store.flush)
+
+    def save_rollups(self):
+        if self.rollups.save():
+            self._write(self.rollups.flush)
+
+    # ================= SESSIONS & GARDEN =================
+    def start_session(self):
+        self._mood_at_start = self.state["mood"]
+
+    def log_session(self, timer, completed):
+        """Record the session ``timer`` is running, finished or cut short."""
+        if timer.started_at is None:
+            return
+        if self.sessions is not None:
+            self.sessions.append(
+                timer.started_at,
+                timer.duration,
+                timer.elapsed(),
+                timer.pause_count,
+                self._mood_at_start,
+                completed
+            )
+            self._write(self.sessions.flush)
+        if self.rollups is not None:
+            # Booked on the day it ends, like complete_session: a session
+            # running over midnight counts towards the new day
+            self.rollups.add_session(self.today(), timer.elapsed(), completed)
+            self.save_rollups()
+
+    def complete_session(self):
+        self.state["today_sessions"] += 1
+        self.streaks.add(self.today())
+        self.grow_garden()
+        self.save()
+
+    def grow_garden(self):
+        """Advance the first plant that isn't in bloom yet."""
+        for plant, stage in self.state["plants"].items():
+            if stage < len(PLANT_STAGES) - 1:
+                self.state.set_in("plants", plant, stage + 1)
+                return plant
+        return None
+
+    # ================= STREAK =================
+    def update_streak(self, today=None):
+        """Bring the streak up to date for ``today``; True if it went up.
+
+        Derived from the active-day index, so missed days reset it and
+        backfilled days count.
+        """
+        today = today or self.today()
+        streak = self.streaks.streak_on(today)
+        grew = streak > self.state.get("streak", 0)
+        self.state["streak"] = streak
+        self.state["longest_streak"] = max(self.state.get("longest_streak", 0), self.streaks.longest)
+        last = self.streaks.last_active(today + timedelta(days=1))
+        if last:
+            self.state["last_active_date"] = str(last)
+        self.save()
+        return grew
+
+    def streak_as_of(self, day):
+        return self.streaks.streak_on(day)
+
+    # ================= DAYS =================
+    def snapshot(self, today=None):
+        return {
+            "date": str(today or self.today()),
+            "sessions": self.state["today_sessions"],
+            "mood": self.state["mood"],
+            "notes": self.state["notes"],
+            "task": self.state["main_task"],
+            "plants": self.state["plants"].copy()
+        }
+
+    def save_today(self, today=None):
+        """Archive today's snapshot to history and start a fresh day."""
+        day = self.snapshot(today)
+        if day["sessions"] > 0:
+            self.streaks.add(date.fromisoformat(day["date"]))
+        self.history.add(day)
+        self._write(self.history.flush)
+        if self.rollups is not None:
+            self.rollups.add_day(date.fromisoformat(day["date"]), day["mood"], day["task"])
+            self.save_rollups()
+        self.reset_day()
+        return day
+
+    def complete_quest(self, task):
+        """The main quest was ticked off; it is counted, then cleared."""
+        if self.rollups is not None and task.strip():
+            self.rollups.add_quest(self.today(), done=True)
+            self.save_rollups()
+        self.state["main_task"] = ""
+        self.save()
+
+    def has_activity(self):
+        s = self.state
+        return bool(s["today_sessions"] or s["mood"] or s["notes"] or s["main_task"])
+
+    def rollover(self, today=None):
+        """Archive the live day if it belongs to an earlier date.
+
+        Covers any number of missed midnights in one go: the stale day is
+        archived under its own date (unless it is empty), the days in
+        between had no activity and need no rows, and the streak is
+        recomputed once. Returns how many midnights were crossed.
+        """
+        today = today or self.today()
+        try:
+            live = date.fromisoformat(self.state.get("day") or "")
+        except ValueError:
+            live = None  # state from before rollovers: adopt it as today's
+        if live is not None and live >= today:
+            return 0
+
+        if live is not None:
+            if self.has_activity():
+                self.save_today(live)
+            else:
+                self.reset_day()
+        self.state["day"] = str(today)
+        self.update_streak(today)
+        return (today - live).days if live else 0
+
+    def seconds_until_midnight(self):
+        now = datetime.now(self.tz)
+        midnight = datetime.combine(now.date() + timedelta(days=1), time.min, tzinfo=now.tzinfo)
+        return (midnight - now).total_seconds()
+
+    def reset_day(self):
+        self.state["today_sessions"] = 0
+        self.state["mood"] = ""
+        self.state["notes"] = ""
+        self.state["main_task"] = ""
+        self.state["task_done"] = False
+        for plant in self.state["plants"]:
+            self.state.set_in("plants", plant, 0)
+        self.save()
@@ -0,0 +1,155 @@
+import json
+import os
+import sqlite3
+import threading
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    date     TEXT,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    mood     TEXT NOT NULL DEFAULT '',
+    task     TEXT NOT NULL DEFAULT '',
+    notes    TEXT NOT NULL DEFAULT '',
+    plants   TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_days_date ON days(date);
+CREATE INDEX IF NOT EXISTS idx_days_mood ON days(mood);
+CREATE INDEX IF NOT EXISTS idx_days_sessions ON days(sessions);
+
+-- Running totals for the quest log header, kept by triggers
+CREATE TABLE IF NOT EXISTS totals (
+    id       INTEGER PRIMARY KEY CHECK (id = 1),
+    days     INTEGER NOT NULL,
+    sessions INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS days_insert AFTER INSERT ON days BEGIN
+    UPDATE totals SET days = days + 1, sessions = sessions + NEW.sessions WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS days_delete AFTER DELETE ON days BEGIN
+    UPDATE totals SET days = days - 1, sessions = sessions - OLD.sessions WHERE id = 1;
+END;
+"""
+
+COLUMNS = "id, date, sessions, mood, task, notes, plants"
+
+
+def format_day(number, day):
+    """Title and body text of a quest log entry."""
+    notes = day["notes"]
+    return f"▸ DAY {number}", f"""⚡ {day['sessions']} sessions
+🎭 Mood: {day['mood'] or 'Not set'}
+⚔️ Quest: {day['task'] or 'None'}
+📝 {notes[:50]}{'...' if len(notes) > 50 else ''}"""
+
+
+class HistoryStore:
+    """Day snapshots kept in a local SQLite database (``data/history.db``).
+
+    ``add`` only queues the row; ``flush`` writes everything queued in one
+    transaction and is meant to run on the persistence thread. Reads flush
+    first so they always see the latest day.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.RLock()
+        self._pending = []
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._lock:
+            self._db.executescript(SCHEMA)
+            # Databases from before the totals table: one scan, then never again
+            if self._db.execute("SELECT 1 FROM totals").fetchone() is None:
+                self._db.execute(
+                    "INSERT INTO totals SELECT 1, COUNT(*), COALESCE(SUM(sessions), 0) FROM days"
+                )
+            self._db.commit()
+
+    # ================= WRITES =================
+    @staticmethod
+    def _row(day):
+        return (
+            day.get("date"),
+            day.get("sessions", 0),
+            day.get("mood") or "",
+            day.get("task") or "",
+            day.get("notes") or "",
+            json.dumps(day.get("plants", {})),
+        )
+
+    def add(self, day):
+        """Queue a day snapshot for the next flush."""
+        with self._lock:
+            self._pending.append(self._row(day))
+
+    def flush(self):
+        with self._lock:
+            rows, self._pending = self._pending, []
+            if not rows:
+                return
+            with self._db:
+                self._db.executemany(
+                    "INSERT INTO days (date, sessions, mood, task, notes, plants) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+
+    def import_legacy(self, days):
+        """Move the old ``state["history"]`` list into the database."""
+        with self._lock:
+            self._pending.extend(self._row(day) for day in days)
+            self.flush()
+
+    # ================= READS =================
+    @staticmethod
+    def _entry(row):
+        entry = dict(row)
+        entry["plants"] = json.loads(entry["plants"])
+        return entry
+
+    def count(self):
+        return self.summary()["days"]
+
+    def page(self, offset=0, limit=-1):
+        """Day snapshots in insertion order (``limit=-1`` means all)."""
+        with self._lock:
+            self.flush()
+            rows = self._db.execute(
+                f"SELECT {COLUMNS} FROM days ORDER BY id LIMIT ? OFFSET ?",
+                (limit, offset)
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def on_date(self, day):
+        with self._lock:
+            self.flush()
+            rows = self._db.execute(
+                f"SELECT {COLUMNS} FROM days WHERE date = ? ORDER BY id", (day,)
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def active_dates(self):
+        """Dates (``YYYY-MM-DD``) of every saved day with at least one session, sorted."""
+        with self._lock:
+            self.flush()
+            rows = self._db.execute(
+                "SELECT DISTINCT date FROM days WHERE sessions > 0 AND date IS NOT NULL ORDER BY date"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def summary(self):
+        """Totals for the quest log header: days and sessions."""
+        with self._lock:
+            self.flush()
+            days, sessions = self._db.execute(
+                "SELECT days, sessions FROM totals WHERE id = 1"
+            ).fetchone()
+        return {"days": days, "sessions": sessions}
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._db.close()
@@ -0,0 +1,185 @@
+import copy
+import json
+import os
+import threading
+
+
+class JournalStore:
+    """Snapshot + append-only journal for the app state.
+
+    The snapshot (``data/state.json``) is only rewritten during compaction.
+    Saves queue small mutation records which ``flush`` appends to
+    ``data/state.journal``:
+
+        {"seq": 12, "op": "set", "key": "mood", "value": "Sleepy"}
+        {"seq": 13, "op": "append", "key": "history", "value": {...}}
+
+    so the cost of a save depends on what changed, not on the size of
+    the state. Lists are treated as append-only (history entries are never
+    edited after being added).
+    """
+
+    def __init__(self, snapshot_path, compact_every=200):
+        self.snapshot_path = snapshot_path
+        self.journal_path = os.path.splitext(snapshot_path)[0] + ".journal"
+        self.compact_every = compact_every
+
+        self._lock = threading.Lock()
+        self._shadow = {}       # last persisted state
+        self._seq = 0           # seq of the last record written
+        self._io_lock = threading.RLock()
+        self._pending = []      # serialized records not yet on disk
+        self._pending_compact = 0
+
+    # ================= LOAD =================
+    def load(self, default):
+        """Read the snapshot, replay the journal on top and return the state."""
+        try:
+            with open(self.snapshot_path, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+
+        snapshot_seq = state.pop("_seq", 0)
+        self._seq = snapshot_seq
+        replayed = 0
+
+        try:
+            with open(self.journal_path, "rb") as f:
+                good = 0  # byte offset just past the last intact record
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("no newline")
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # torn write at the tail, ignore the rest
+                    good += len(line)
+                    if record["seq"] <= snapshot_seq:
+                        continue  # already folded into the snapshot
+                    self._apply(state, record)
+                    self._seq = record["seq"]
+                    replayed += 1
+                torn = f.seek(0, os.SEEK_END) - good
+            if torn:
+                # Cut it off, or the next flush would append onto the torn line
+                print(f"[STATE] dropping {torn} bytes of a torn journal record")
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(good)
+        except OSError:
+            pass
+
+        for key, value in default.items():
+            state.setdefault(key, copy.deepcopy(value))
+
+        self._shadow = self._copy_state(state)
+        self._pending_compact = replayed
+        return state
+
+    @staticmethod
+    def _apply(state, record):
+        op, key = record["op"], record["key"]
+        if op == "set":
+            state[key] = record["value"]
+        elif op == "append":
+            state.setdefault(key, []).append(record["value"])
+        elif op == "del":
+            state.pop(key, None)
+
+    @staticmethod
+    def _copy_state(state):
+        # Lists only ever grow, so a shallow copy is enough to diff them
+        return {
+            k: list(v) if isinstance(v, list) else copy.deepcopy(v)
+            for k, v in state.items()
+        }
+
+    # ================= SAVE =================
+    def _diff(self, state, keys=None):
+        """Build journal records for what changed since the last save.
+
+        With ``keys`` only those keys are compared, so the cost does not
+        grow with the number of keys in the state.
+        """
+        records = []
+        shadow = self._shadow
+
+        if keys is None:
+            keys = list(state) + [k for k in shadow if k not in state]
+        for key in keys:
+            if key not in state:
+                if key in shadow:
+                    records.append({"op": "del", "key": key})
+                    del shadow[key]
+                continue
+
+            value = state[key]
+            old = shadow.get(key)
+            if isinstance(value, list) and isinstance(old, list) and len(value) >= len(old):
+                for item in value[len(old):]:
+                    records.append({"op": "append", "key": key, "value": item})
+                    old.append(item)
+            elif key not in shadow or old != value:
+                records.append({"op": "set", "key": key, "value": value})
+                shadow[key] = list(value) if isinstance(value, list) else copy.deepcopy(value)
+
+        return records
+
+    def save(self, state, keys=None):
+        """Queue the changes made to ``state`` (or just to ``keys``) since the last save.
+
+        Records are serialized right away (the caller keeps mutating
+        ``state``) but only hit the disk on the next ``flush``.
+        """
+        with self._lock:
+            for record in self._diff(state, keys):
+                self._seq += 1
+                record["seq"] = self._seq
+                self._pending.append(json.dumps(record) + "\n")
+            return bool(self._pending)
+
+    def flush(self):
+        """Append queued records to the journal in a single write."""
+        with self._io_lock:
+            with self._lock:
+                lines, self._pending = self._pending, []
+            if not lines:
+                return
+
+            os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+            with open(self.journal_path, "a") as f:
+                f.write("".join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._pending_compact += len(lines)
+            if self._pending_compact >= self.compact_every:
+                self.compact()
+
+    # ================= COMPACTION =================
+    def compact(self):
+        """Fold the journal into a fresh snapshot (temp file + rename)."""
+        with self._io_lock:
+            try:
+                with self._lock:
+                    snapshot = dict(self._shadow)
+                    for key, value in snapshot.items():
+                        if isinstance(value, list):
+                            snapshot[key] = list(value)
+                    # Queued records are part of the snapshot already and
+                    # will be skipped on replay once they are flushed
+                    snapshot["_seq"] = self._seq
+
+                tmp_path = self.snapshot_path + ".tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(snapshot, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.snapshot_path)
+
+                # Every flushed record is covered by the snapshot now
+                with open(self.journal_path, "w"):
+                    pass
+                self._pending_compact = 0
+            except OSError as e:
+                print(f"[STATE COMPACT FAILED] {e}")
@@ -0,0 +1,132 @@
+import copy
+from datetime import date, datetime
+
+from core.journal import JournalStore
+
+
+PERIODS = ("day", "week", "month", "year")
+REBUILT = "rebuilt"  # marker key: history from before rollups was folded in
+
+
+def period_key(period, day):
+    """``day/2026-10-17``, ``week/2026-W42``, ``month/2026-10`` or ``year/2026``."""
+    if period == "day":
+        label = day.isoformat()
+    elif period == "week":
+        year, week, _ = day.isocalendar()
+        label = f"{year}-W{week:02d}"
+    elif period == "month":
+        label = f"{day.year}-{day.month:02d}"
+    elif period == "year":
+        label = str(day.year)
+    else:
+        raise ValueError(f"unknown period {period!r}")
+    return f"{period}/{label}"
+
+
+def empty_bucket():
+    return {
+        "sessions": 0,
+        "focus_minutes": 0.0,
+        "days": 0,
+        "moods": {},
+        "quests": 0,
+        "quests_done": 0,
+    }
+
+
+class Rollups:
+    """Running totals per day, ISO week, month and year.
+
+    Each focus session and each saved day adds to the four buckets it
+    falls in, so a weekly or monthly view is one dict lookup instead of a
+    history scan. Buckets are flat keys (``week/2026-W42``) in a
+    JournalStore (``data/rollups.json`` + ``.journal``), so a save only
+    writes the handful of buckets that changed.
+    """
+
+    def __init__(self, path):
+        self.store = JournalStore(path, compact_every=500)
+        self.data = self.store.load({})
+        self._dirty = set()
+
+    @property
+    def empty(self):
+        return not any(key != REBUILT for key in self.data)
+
+    @property
+    def rebuilt(self):
+        return bool(self.data.get(REBUILT))
+
+    def mark_rebuilt(self):
+        self.data[REBUILT] = True
+        self._dirty.add(REBUILT)
+
+    # ================= UPDATES =================
+    def _buckets(self, day):
+        for period in PERIODS:
+            key = period_key(period, day)
+            bucket = self.data.get(key)
+            if bucket is None:
+                bucket = self.data[key] = empty_bucket()
+            self._dirty.add(key)
+            yield bucket
+
+    def add_session(self, day, focus_seconds, completed=True):
+        """A focus session on ``day``; cut-short sessions only add their minutes."""
+        for bucket in self._buckets(day):
+            bucket["focus_minutes"] = round(bucket["focus_minutes"] + focus_seconds / 60, 2)
+            if completed:
+                bucket["sessions"] += 1
+
+    def add_day(self, day, mood="", task="", sessions=0):
+        """A day saved to history; ``task`` is a quest left unfinished.
+
+        ``sessions`` is only set when backfilling.
+        """
+        for bucket in self._buckets(day):
+            bucket["days"] += 1
+            bucket["sessions"] += sessions
+            if mood:
+                bucket["moods"][mood] = bucket["moods"].get(mood, 0) + 1
+            if task:
+                bucket["quests"] += 1
+
+    def add_quest(self, day, done=True):
+        for bucket in self._buckets(day):
+            bucket["quests"] += 1
+            if done:
+                bucket["quests_done"] += 1
+
+    def rebuild(self, history, sessions=None):
+        """One-off backfill from data written before rollups existed.
+
+        Sets the ``rebuilt`` marker and returns the number of buckets.
+        """
+        for entry in history.page():
+            try:
+                day = date.fromisoformat(entry["date"] or "")
+            except ValueError:
+                continue  # very old entries have no date
+            self.add_day(day, entry["mood"], entry["task"], sessions=entry["sessions"])
+        if sessions is not None:
+            for session in sessions:
+                day = datetime.fromtimestamp(session.start).date()
+                for bucket in self._buckets(day):
+                    bucket["focus_minutes"] = round(bucket["focus_minutes"] + session.actual / 60, 2)
+        self.mark_rebuilt()
+        return len(self.data) - 1
+
+    def save(self):
+        """Queue the changed buckets; True if ``flush`` has something to write."""
+        keys, self._dirty = self._dirty, set()
+        return bool(keys) and self.store.save(self.data, keys)
+
+    def flush(self):
+        self.store.flush()
+
+    # ================= READS =================
+    def get(self, period, day=None):
+        """Totals of the ``period`` containing ``day`` (today by default)."""
+        bucket = self.data.get(period_key(period, day or date.today()))
+        return copy.deepcopy(bucket) if bucket else empty_bucket()
@@ -0,0 +1,138 @@
+import os
+import struct
+import threading
+import time
+from collections import namedtuple
+
+
+# File header: magic, format version, record size
+HEADER = struct.Struct("<4sHH")
+MAGIC = b"PSES"
+VERSION = 1
+
+# start epoch (s), planned (s), actual (s), pauses, mood code, flags
+RECORD = struct.Struct("<qIIHBB")
+COMPLETED = 1
+
+MOODS = ("", "Sleepy", "Motivated", "Angry", "Sad")
+
+Session = namedtuple("Session", "start planned actual pauses mood completed")
+
+
+def mood_code(mood):
+    return MOODS.index(mood) if mood in MOODS else 0
+
+
+class SessionLog:
+    """Every focus session as a fixed-width 20 byte record (``data/sessions.bin``).
+
+    The file is append-only: ``append`` packs the record and ``flush``
+    writes everything queued with a single write, so adding a session
+    costs the same whatever the file size. Reads stream the file in
+    chunks with ``struct.iter_unpack`` and never hold more than one chunk
+    in memory. A torn record at the tail (crash mid-write) is cut off on
+    open so later appends stay aligned.
+    """
+
+    CHUNK = 4096  # records per read
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending = []
+        self._open()
+
+    def _open(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+        if size < HEADER.size:
+            with open(self.path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+            return
+
+        with open(self.path, "rb") as f:
+            magic, version, record_size = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or record_size != RECORD.size:
+            # Keep the unreadable file for inspection and start a fresh log
+            aside = f"{self.path}.bad-{int(time.time())}"
+            os.replace(self.path, aside)
+            print(f"[SESSIONS] {self.path} is not a v{VERSION} session log, moved to {aside}")
+            self._open()
+            return
+
+        torn = (size - HEADER.size) % RECORD.size
+        if torn:
+            print(f"[SESSIONS] dropping {torn} bytes of a torn record")
+            with open(self.path, "r+b") as f:
+                f.truncate(size - torn)
+
+    # ================= WRITES =================
+    def append(self, start, planned, actual, pauses=0, mood="", completed=True):
+        """Queue one session; times in seconds, ``start`` as a Unix epoch."""
+        record = RECORD.pack(
+            int(start),
+            max(0, int(planned)),
+            max(0, int(round(actual))),
+            min(pauses, 0xFFFF),
+            mood_code(mood),
+            COMPLETED if completed else 0,
+        )
+        with self._lock:
+            self._pending.append(record)
+
+    def flush(self):
+        with self._lock:
+            data, self._pending = b"".join(self._pending), []
+            if not data:
+                return
+            with open(self.path, "ab") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+    # ================= READS =================
+    def count(self):
+        self.flush()
+        return (os.path.getsize(self.path) - HEADER.size) // RECORD.size
+
+    def raw(self):
+        """Yield record tuples as stored, chunk by chunk."""
+        self.flush()
+        with open(self.path, "rb") as f:
+            f.seek(HEADER.size)
+            while True:
+                chunk = f.read(RECORD.size * self.CHUNK)
+                if not chunk:
+                    return
+                chunk = chunk[:len(chunk) - len(chunk) % RECORD.size]
+                yield from RECORD.iter_unpack(chunk)
+
+    def __iter__(self):
+        for start, planned, actual, pauses, mood, flags in self.raw():
+            yield Session(start, planned, actual, pauses, MOODS[mood] if mood < len(MOODS) else "",
+                          bool(flags & COMPLETED))
+
+    def stats(self, since=None, until=None):
+        """Totals over sessions started in [since, until) (Unix epochs)."""
+        count = completed = paused = planned = focus = 0
+        for start, p, actual, pauses, _, flags in self.raw():
+            if (since is not None and start < since) or (until is not None and start >= until):
+                continue
+            count += 1
+            planned += p
+            focus += actual
+            if flags & COMPLETED:
+                completed += 1
+            if pauses:
+                paused += 1
+        return {
+            "sessions": count,
+            "completed": completed,
+            "abandoned": count - completed,
+            "paused": paused,
+            "planned_seconds": planned,
+            "focus_seconds": focus,
+        }
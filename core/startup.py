@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+ENV_FLAG = "PETAL_PROFILE_STARTUP"
+CLI_FLAG = "--profile-startup"
+
+
+class StartupProfiler:
+    """Times app start-up: module imports, each __init__ phase and milestones.
+
+    Timing is always on (it is a couple of perf_counter calls); the report
+    is only printed when ``PETAL_PROFILE_STARTUP=1`` is set or the app is
+    started with ``--profile-startup``.
+    """
+
+    def __init__(self, enabled=None, target_ms=800):
+        if enabled is None:
+            enabled = os.environ.get(ENV_FLAG) == "1" or CLI_FLAG in sys.argv
+        self.enabled = enabled
+        self.target_ms = target_ms
+        self.start = time.perf_counter()
+        self.phases = []  # (name, duration ms)
+        self.marks = []   # (name, ms since start)
+
+    def elapsed(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - t0) * 1000))
+
+    def mark(self, name):
+        self.marks.append((name, self.elapsed()))
+
+    def report(self, milestone):
+        """Print the breakdown; ``milestone`` is the mark checked against the target."""
+        if not self.enabled:
+            return
+        print("[STARTUP] phase                          ms")
+        for name, ms in self.phases:
+            print(f"[STARTUP]   {name:<28} {ms:7.1f}")
+        for name, ms in self.marks:
+            print(f"[STARTUP] @ {name:<28} {ms:7.1f}")
+
+        reached = dict(self.marks).get(milestone)
+        if reached is not None:
+            verdict = "OK" if reached <= self.target_ms else "OVER"
+            print(f"[STARTUP] {milestone}: {reached:.0f} ms (target {self.target_ms} ms) {verdict}")
@@ -0,0 +1,92 @@
+import fnmatch
+
+
+class StateStore:
+    """Observable wrapper around the app state dict.
+
+    Reads work like a dict. Writes go through ``__setitem__`` or
+    ``set_in`` (for nested values like ``plants.rose``); a write that
+    changes nothing is ignored. Changed keys are collected in two dirty
+    sets:
+
+    * one for the UI: subscribers bound to a key or pattern
+      (``"today_sessions"``, ``"plants.*"``) run once per flush, and the
+      flush is scheduled once per event-loop turn through ``schedule``;
+    * one for persistence: ``take_unsaved`` hands the top-level keys
+      changed since the last save to the journal.
+    """
+
+    def __init__(self, data, schedule=None):
+        self._data = data
+        self._schedule = schedule
+        self._subscribers = []  # (pattern, callback)
+        self._dirty = set()
+        self._unsaved = set()
+        self._flush_pending = False
+
+    # ================= DICT-LIKE READS =================
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def items(self):
+        return self._data.items()
+
+    # ================= WRITES =================
+    def __setitem__(self, key, value):
+        if key in self._data and self._data[key] == value:
+            return
+        self._data[key] = value
+        self.mark(key)
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self.mark(key)
+
+    def set_in(self, key, sub, value):
+        """``state[key][sub] = value`` with change tracking."""
+        container = self._data[key]
+        if container.get(sub) == value:
+            return
+        container[sub] = value
+        self.mark(key, f"{key}.{sub}")
+
+    def mark(self, key, path=None):
+        self._unsaved.add(key)
+        self._dirty.add(path or key)
+        if path:
+            self._dirty.add(key)
+        if self._schedule and not self._flush_pending:
+            self._flush_pending = True
+            self._schedule(self.flush)
+
+    def take_unsaved(self):
+        keys, self._unsaved = self._unsaved, set()
+        return keys
+
+    # ================= SUBSCRIPTIONS =================
+    def subscribe(self, pattern, callback):
+        self._subscribers.append((pattern, callback))
+
+    def flush(self):
+        """Run each subscriber whose key changed, once."""
+        self._flush_pending = False
+        dirty, self._dirty = self._dirty, set()
+        called = set()
+        for pattern, callback in self._subscribers:
+            if callback in called:
+                continue
+            if any(fnmatch.fnmatchcase(key, pattern) for key in dirty):
+                called.add(callback)
+                callback()
@@ -0,0 +1,71 @@
+import bisect
+from datetime import date, datetime
+
+
+def local_day(timestamp, tz=None):
+    """Calendar day of a Unix timestamp in ``tz`` (the system zone if None)."""
+    return datetime.fromtimestamp(timestamp, tz).date()
+
+
+class StreakIndex:
+    """Sorted index of active days for streak lookups in O(log n).
+
+    Days are kept as ordinals in a sorted list, next to the ordinal where
+    each day's run of consecutive days starts. The streak on any day is a
+    bisect plus a subtraction, so no query walks the history. Days can be
+    added in any order (a backfilled day can join two runs); an insert
+    only touches the run it lands in.
+    """
+
+    def __init__(self, days=()):
+        self._days = []    # sorted ordinals of active days
+        self._starts = []  # ordinal of the first day of each day's run
+        self.longest = 0
+        for day in sorted(set(days)):
+            self.add(day)
+
+    def __len__(self):
+        return len(self._days)
+
+    def add(self, day):
+        """Mark ``day`` active; returns False if it already was."""
+        x = day.toordinal()
+        i = bisect.bisect_left(self._days, x)
+        if i < len(self._days) and self._days[i] == x:
+            return False
+
+        start = self._starts[i - 1] if i and self._days[i - 1] == x - 1 else x
+        self._days.insert(i, x)
+        self._starts.insert(i, start)
+
+        # The run that began the day after now continues this one
+        end = x
+        j = i + 1
+        while j < len(self._days) and self._days[j] == end + 1:
+            self._starts[j] = start
+            end += 1
+            j += 1
+        self.longest = max(self.longest, end - start + 1)
+        return True
+
+    def active(self, day):
+        x = day.toordinal()
+        i = bisect.bisect_left(self._days, x)
+        return i < len(self._days) and self._days[i] == x
+
+    def streak_on(self, day):
+        """Streak shown on ``day``.
+
+        A day without sessions (yet) keeps the streak that ran up to the
+        day before; one full missed day resets it to 0.
+        """
+        x = day.toordinal()
+        i = bisect.bisect_right(self._days, x) - 1
+        if i < 0 or self._days[i] < x - 1:
+            return 0
+        return self._days[i] - self._starts[i] + 1
+
+    def last_active(self, before=None):
+        """Latest active day (strictly before ``before`` if given), or None."""
+        i = len(self._days) if before is None else bisect.bisect_left(self._days, before.toordinal())
+        return date.fromordinal(self._days[i - 1]) if i else None
@@ -0,0 +1,71 @@
+import math
+import time
+
+
+class FocusTimer:
+    """Focus countdown kept as a ``time.monotonic()`` deadline.
+
+    Nothing is decremented per tick: the remaining time is computed from
+    the deadline whenever it is asked for, so late or skipped UI updates
+    never make a session run long. Pausing stores what was left and
+    resuming sets a fresh deadline from it.
+    """
+
+    def __init__(self, clock=time.monotonic, wall=time.time):
+        self.clock = clock
+        self.wall = wall
+        self.duration = 0
+        self.started_at = None  # wall-clock epoch, for the session log
+        self.pause_count = 0
+        self._deadline = None
+        self._left_when_paused = None
+
+    @property
+    def running(self):
+        return self._deadline is not None or self._left_when_paused is not None
+
+    @property
+    def paused(self):
+        return self._left_when_paused is not None
+
+    def start(self, seconds):
+        self.duration = seconds
+        self.started_at = self.wall()
+        self.pause_count = 0
+        self._deadline = self.clock() + seconds
+        self._left_when_paused = None
+
+    def stop(self):
+        self._deadline = None
+        self._left_when_paused = None
+
+    def pause(self):
+        if self._deadline is not None:
+            self._left_when_paused = self.remaining()
+            self._deadline = None
+            self.pause_count += 1
+
+    def resume(self):
+        if self._left_when_paused is not None:
+            self._deadline = self.clock() + self._left_when_paused
+            self._left_when_paused = None
+
+    def remaining(self):
+        """Seconds left, as a float (0 when finished or stopped)."""
+        if self._left_when_paused is not None:
+            return self._left_when_paused
+        if self._deadline is None:
+            return 0.0
+        return max(0.0, self._deadline - self.clock())
+
+    def seconds_left(self):
+        """Whole seconds shown on the display (25:00 right after start)."""
+        return math.ceil(self.remaining())
+
+    def elapsed(self):
+        return self.duration - self.remaining()
+
+    def until_next_second(self):
+        """Delay until ``seconds_left`` changes, i.e. the next display update."""
+        remaining = self.remaining()
+        return remaining - (math.ceil(remaining) - 1) if remaining > 0 else 0.0
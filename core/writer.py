@@ -0,0 +1,67 @@
+import threading
+import time
+
+
+class PersistenceWorker:
+    """Background thread that runs save jobs off the Tk main loop.
+
+    Jobs requested during one debounce window are coalesced: requesting
+    the same job five times in a burst runs it once, ``delay`` seconds
+    after the first request.
+    """
+
+    def __init__(self, delay=0.5):
+        self.delay = delay
+        self._jobs = {}  # insertion-ordered set of callables
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="petal-persist", daemon=True)
+        self._thread.start()
+
+    def request(self, job):
+        """Schedule ``job`` for the next write window."""
+        with self._cond:
+            if self._closed:
+                run_now = True
+            else:
+                run_now = False
+                self._jobs[job] = None
+                self._cond.notify()
+        if run_now:
+            self._call(job)
+
+    def close(self, timeout=10):
+        """Run whatever is still pending and stop the thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._jobs and not self._closed:
+                    self._cond.wait()
+                if not self._jobs:
+                    return
+
+                # Let the rest of the burst arrive before writing
+                deadline = time.monotonic() + self.delay
+                while not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                jobs = list(self._jobs)
+                self._jobs.clear()
+
+            for job in jobs:
+                self._call(job)
+
+    @staticmethod
+    def _call(job):
+        try:
+            job()
+        except Exception as e:
+            print(f"[SAVE FAILED] {getattr(job, '__qualname__', job)} -> {e}")
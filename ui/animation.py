@@ -0,0 +1,96 @@
+import time
+
+
+def _parse(color):
+    if isinstance(color, str) and color.startswith("#") and len(color) == 7:
+        return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return None
+
+
+def mix(a, b, t):
+    """Blend two ``#rrggbb`` colors; None if either is not a plain hex color."""
+    ca, cb = _parse(a), _parse(b)
+    if ca is None or cb is None:
+        return None
+    return "#" + "".join(f"{round(x + (y - x) * t):02x}" for x, y in zip(ca, cb))
+
+
+class Tween:
+    __slots__ = ("widget", "prop", "color", "base", "start", "duration", "applied")
+
+    def __init__(self, widget, prop, color, base, start, duration):
+        self.widget = widget
+        self.prop = prop
+        self.color = color
+        self.base = base
+        self.start = start
+        self.duration = duration
+        self.applied = None
+
+
+class Animator:
+    """Runs every widget color animation in one fixed-rate frame loop.
+
+    A flash sets ``prop`` to ``color`` and fades it back to the widget's
+    base value over ``duration_ms``. Flashing a widget property that is
+    already animating replaces the running tween but keeps its original
+    base, so overlapping flashes never "restore" the flash color. Progress
+    comes from the clock, not the frame count: when the main thread is
+    busy, frames are dropped instead of queued.
+    """
+
+    FPS = 30
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self._tweens = {}  # (widget path, prop) -> Tween
+
+    def flash(self, widget, prop, color, duration_ms, restore=None):
+        key = (str(widget), prop)
+        old = self._tweens.get(key)
+        if restore is not None:
+            base = restore
+        elif old is not None:
+            base = old.base
+        else:
+            try:
+                base = widget.cget(prop)
+            except Exception:
+                return
+
+        tween = Tween(widget, prop, color, base, time.monotonic(), duration_ms / 1000)
+        self._tweens[key] = tween
+        self._apply(key, tween, color)
+        if not self.scheduler.pending("animation"):
+            self.scheduler.call_later(1000 // self.FPS, self._frame, key="animation", throttle=True)
+
+    def cancel(self, widget, prop):
+        """Stop an animation and put the base value back."""
+        key = (str(widget), prop)
+        tween = self._tweens.get(key)
+        if tween is not None:
+            self._apply(key, tween, tween.base)
+            self._tweens.pop(key, None)
+
+    def _apply(self, key, tween, value):
+        if value == tween.applied:
+            return  # nothing visible changes, skip the configure
+        try:
+            tween.widget.configure(**{tween.prop: value})
+            tween.applied = value
+        except Exception:
+            self._tweens.pop(key, None)  # widget destroyed meanwhile
+
+    def _frame(self):
+        now = time.monotonic()
+        for key, tween in list(self._tweens.items()):
+            t = (now - tween.start) / tween.duration
+            if t >= 1:
+                self._apply(key, tween, tween.base)
+                self._tweens.pop(key, None)
+            else:
+                # Colors that can't be blended (e.g. "transparent") snap back at the end
+                self._apply(key, tween, mix(tween.color, tween.base, t * t) or tween.color)
+
+        if self._tweens:
+            self.scheduler.call_later(1000 // self.FPS, self._frame, key="animation", throttle=True)
@@ -0,0 +1,275 @@
+import hashlib
+import json
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import customtkinter as ctk
+from PIL import Image
+
+
+ATLAS_VERSION = 1
+ATLAS_WIDTH = 1024
+
+
+def sprite_key(path, size):
+    return f"{path}@{size[0]}x{size[1]}"
+
+
+class AssetLoader:
+    """Decodes image assets straight down to the size they are shown at.
+
+    Only a copy at ``scale`` times the display size (2x covers HiDPI
+    screens) is kept; the full-resolution decode is dropped right away.
+    ``resident_bytes`` tracks the RGBA bitmap memory that stays alive,
+    ``source_bytes`` what the full-size decodes would have used.
+
+    With a ``cache_dir``, ``prepare`` packs the resampled sprites into a
+    single atlas PNG plus a JSON index keyed by the source file hashes.
+    Later launches decode that one file and slice it; any change to a
+    source, the scale or the atlas format falls back to a rebuild.
+    """
+    def __init__(self, resolve, scale=2, cache_dir=None):
+        self.resolve = resolve
+        self.scale = scale
+        self.cache_dir = cache_dir
+        self.count = 0
+        self.resident_bytes = 0
+        self.source_bytes = 0
+        self.from_atlas = False
+        self._sprites = {}  # sprite key -> RGBA image sliced from the atlas
+        self._lock = threading.Lock()  # decodes may run on several threads
+
+    def target_size(self, size, source_size):
+        # Never upscale: a small source is kept as it is
+        return (
+            min(size[0] * self.scale, source_size[0]),
+            min(size[1] * self.scale, source_size[1]),
+        )
+
+    def decode(self, path, size):
+        """Open ``path`` and return an RGBA image resampled for ``size``."""
+        with Image.open(self.resolve(path)) as src:
+            target = self.target_size(size, src.size)
+            source_size = src.size
+            src.draft("RGB", target)  # JPEG sources decode at reduced scale
+            img = src.convert("RGBA").resize(target, Image.LANCZOS)
+            img.info["source_size"] = source_size
+
+        with self._lock:
+            self.count += 1
+            self.resident_bytes += img.width * img.height * 4
+            self.source_bytes += source_size[0] * source_size[1] * 4
+        return img
+
+    def take(self, path, size):
+        """Resampled RGBA image, from the atlas when it has it."""
+        img = self._sprites.pop(sprite_key(path, size), None)
+        if img is None:
+            img = self.decode(path, size)
+        return img
+
+    def load(self, path, size):
+        return ctk.CTkImage(self.take(path, size), size=size)
+
+    # ================= ATLAS CACHE =================
+    @property
+    def index_path(self):
+        return os.path.join(self.cache_dir, f"sprites-v{ATLAS_VERSION}.json")
+
+    def prepare(self, wanted):
+        """Slice ``wanted`` [(path, size), ...] out of the atlas cache.
+
+        Rebuilds the atlas when it is missing or stale; sprites that
+        still fail to load are left to ``load`` to report.
+        """
+        if not self.cache_dir:
+            return
+        try:
+            if self._load_atlas(wanted):
+                return
+        except FileNotFoundError:
+            pass  # first run
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[ATLAS STALE] {e}")
+        self._build_atlas(wanted)
+
+    def _fingerprints(self, paths, known):
+        """Hash each source file, trusting a stored hash while size and mtime match."""
+        prints = {}
+        for path in paths:
+            st = os.stat(self.resolve(path))
+            old = known.get(path)
+            if old and old["mtime_ns"] == st.st_mtime_ns and old["size"] == st.st_size:
+                prints[path] = old
+                continue
+            with open(self.resolve(path), "rb") as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+            prints[path] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha1": digest}
+        return prints
+
+    def _load_atlas(self, wanted):
+        with open(self.index_path, "r") as f:
+            index = json.load(f)
+        if index["version"] != ATLAS_VERSION or index["scale"] != self.scale:
+            return False
+
+        paths = {path for path, _ in wanted}
+        prints = self._fingerprints(paths, index["sources"])
+        for path in paths:
+            if index["sources"].get(path, {}).get("sha1") != prints[path]["sha1"]:
+                return False
+        keys = [sprite_key(path, size) for path, size in wanted]
+        if any(key not in index["sprites"] for key in keys):
+            return False
+
+        with Image.open(os.path.join(self.cache_dir, index["atlas"])) as atlas:
+            atlas = atlas.convert("RGBA")
+        for key in keys:
+            x, y, w, h, src_w, src_h = index["sprites"][key]
+            self._sprites[key] = atlas.crop((x, y, x + w, y + h))
+            with self._lock:
+                self.count += 1
+                self.resident_bytes += w * h * 4
+                self.source_bytes += src_w * src_h * 4
+        self.from_atlas = True
+        return True
+
+    def _build_atlas(self, wanted):
+        sprites = []
+        for path, size in wanted:
+            try:
+                img = self.decode(path, size)
+            except Exception as e:
+                print(f"[IMG LOAD FAILED] {path} -> {e}")
+                continue
+            sprites.append((path, size, img))
+            self._sprites[sprite_key(path, size)] = img
+
+        # Shelf packing: tallest first, rows ATLAS_WIDTH wide
+        layout = {}
+        x = y = shelf = 0
+        for path, size, img in sorted(sprites, key=lambda s: -s[2].height):
+            if x + img.width > ATLAS_WIDTH:
+                x, y, shelf = 0, y + shelf, 0
+            # The source size is only kept for the memory report
+            layout[sprite_key(path, size)] = [x, y, img.width, img.height, *img.info["source_size"]]
+            x += img.width
+            shelf = max(shelf, img.height)
+
+        try:
+            self._write_atlas(sprites, layout, max(y + shelf, 1))
+        except OSError as e:
+            print(f"[ATLAS WRITE FAILED] {e}")
+
+    def _write_atlas(self, sprites, layout, height):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        paths = sorted({path for path, _, _ in sprites})
+        prints = self._fingerprints(paths, {})
+        build = hashlib.sha1(
+            json.dumps([prints, layout, self.scale], sort_keys=True).encode()
+        ).hexdigest()[:12]
+        name = f"sprites-v{ATLAS_VERSION}-{build}.png"
+
+        atlas = Image.new("RGBA", (ATLAS_WIDTH, height), (0, 0, 0, 0))
+        for path, size, img in sprites:
+            x, y = layout[sprite_key(path, size)][:2]
+            atlas.paste(img, (x, y))
+        atlas.save(os.path.join(self.cache_dir, name))
+
+        # The index is swapped in last, so it never points at a half-written atlas
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({
+                "version": ATLAS_VERSION,
+                "scale": self.scale,
+                "atlas": name,
+                "sources": prints,
+                "sprites": layout,
+            }, f, indent=2)
+        os.replace(tmp, self.index_path)
+
+        for old in os.listdir(self.cache_dir):
+            if old.startswith("sprites-") and old.endswith(".png") and old != name:
+                os.remove(os.path.join(self.cache_dir, old))
+
+    def report(self):
+        return (
+            f"[ASSETS] {self.count} images, "
+            f"{self.resident_bytes / 1024:.0f} KB resident "
+            f"(full size: {self.source_bytes / 1024:.0f} KB)"
+            f"{', from atlas cache' if self.from_atlas else ''}"
+        )
+
+
+class AssetService:
+    """Hands out images right away and decodes them on a thread pool.
+
+    ``image`` returns a CTkImage holding a transparent placeholder and
+    queues the real decode the first time a sprite is asked for. Decoded
+    images come back through a queue drained on the Tk thread, where
+    ``CTkImage.configure`` makes every widget showing the placeholder
+    redraw with the real picture. With ``report=True`` the loader's memory
+    report is printed once, when the first batch of images is in.
+    """
+    def __init__(self, scheduler, loader, workers=4, report=False):
+        self.scheduler = scheduler
+        self.loader = loader
+        self.report = report
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="petal-assets")
+        self._ready = queue.SimpleQueue()
+        self._images = {}  # sprite key -> CTkImage
+        self._prepared = None
+        self._outstanding = 0
+
+    def start(self, wanted):
+        """Load (or rebuild) the sprite atlas in the background."""
+        self._prepared = self._pool.submit(self.loader.prepare, wanted)
+
+    def image(self, path, size):
+        key = sprite_key(path, size)
+        img = self._images.get(key)
+        if img is None:
+            placeholder = Image.new("RGBA", size, (0, 0, 0, 0))
+            img = self._images[key] = ctk.CTkImage(placeholder, size=size)
+            self._outstanding += 1
+            self._pool.submit(self._decode, key, path, size)
+            self._schedule_pump()
+        return img
+
+    def _decode(self, key, path, size):
+        # Worker thread: no Tk calls in here
+        img = None
+        try:
+            if self._prepared is not None:
+                self._prepared.result()
+            img = self.loader.take(path, size)
+        except FileNotFoundError:
+            print(f"[IMG NOT FOUND] {path}")
+        except Exception as e:
+            print(f"[IMG LOAD FAILED] {path} -> {e}")
+        self._ready.put((key, img))
+
+    def _schedule_pump(self):
+        if not self.scheduler.pending("assets"):
+            self.scheduler.call_later(15, self._pump, key="assets")
+
+    def _pump(self):
+        while True:
+            try:
+                key, img = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            if img is not None:
+                self._images[key].configure(light_image=img)
+
+        if self._outstanding:
+            self._schedule_pump()
+        elif self.report:
+            self.report = False
+            print(self.loader.report())
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
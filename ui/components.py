@@ -1,3 +1,6 @@
+import tkinter as tk
+from tkinter import font as tkfont
+
 import customtkinter as ctk
 from ui.theme import *
 
@@ -186,13 +189,13 @@ class PixelBadge(ctk.CTkFrame):
         text_frame = ctk.CTkFrame(content, fg_color="transparent")
         text_frame.pack(side="left", padx=(0, 8))
         
-        value_label = ctk.CTkLabel(
+        self.value_label = ctk.CTkLabel(
             text_frame,
             text=str(value),
             font=("Pixelify Sans", 16, "bold"),
             text_color=TEXT
         )
-        value_label.pack()
+        self.value_label.pack()
         
         if label:
             label_label = ctk.CTkLabel(
@@ -201,4 +204,151 @@ class PixelBadge(ctk.CTkFrame):
                 font=("Poppins", 10),
                 text_color=SUBTEXT
             )
-            label_label.pack()
\ No newline at end of file
+            label_label.pack()
+
+    def set_value(self, value):
+        """Update the displayed value"""
+        self.value_label.configure(text=str(value))
+
+
+# ================= CANVAS COMPONENTS =================
+# Same look as Card / PixelBadge / PixelProgressBar, but borders, title
+# bars and fills are drawn on a single canvas instead of nested CTkFrames
+# (each of which is a canvas of its own).
+
+def _widget_scaling(widget):
+    """CTk's scaling factor for ``widget`` (1.0 outside a CTk window)."""
+    try:
+        return ctk.ScalingTracker.get_widget_scaling(widget)
+    except Exception:
+        return 1.0
+
+
+def _px(size, scaling):
+    # CTk font sizes are pixels; negative Tk font sizes are pixels, positive are points
+    return -round(size * scaling)
+
+
+class CanvasCard(tk.Canvas):
+    """Pixel-style game card drawn on one canvas"""
+    BORDER = 3
+    TITLE_HEIGHT = 40
+
+    def __init__(self, parent, title):
+        super().__init__(parent, bg=PIXEL_BORDER, highlightthickness=0, bd=0)
+        scaling = _widget_scaling(self)
+        self.title_height = round(self.TITLE_HEIGHT * scaling)
+        self.configure(height=self.BORDER * 2 + self.title_height)
+        
+        self.pack(padx=20, pady=12, fill="x")
+        
+        # Title bar shares the border color, so it is just text on the background
+        self.create_text(
+            self.BORDER + 16,
+            self.BORDER + self.title_height // 2,
+            text=f"▸ {title.upper()}",  # Arrow + uppercase for game feel
+            fill=TITLE_GLOW,
+            font=("Pixelify Sans", _px(16, scaling), "bold"),
+            anchor="w"
+        )
+        
+        # Main content frame
+        self.content_frame = tk.Frame(self, bg=CARD_BG, bd=0, highlightthickness=0)
+        self._window = self.create_window(
+            self.BORDER,
+            self.BORDER + self.title_height,
+            window=self.content_frame,
+            anchor="nw"
+        )
+        
+        self.bind("<Configure>", self._on_resize)
+        self.content_frame.bind("<Configure>", self._on_content_resize)
+        
+    def _on_resize(self, event):
+        self.itemconfigure(self._window, width=max(1, event.width - self.BORDER * 2))
+    
+    def _on_content_resize(self, event):
+        height = event.height + self.BORDER * 2 + self.title_height
+        if int(self.cget("height")) != height:
+            self.configure(height=height)
+        
+    def add_content(self, widget):
+        """Helper to add content to the card"""
+        widget.pack(in_=self.content_frame)
+
+
+class CanvasBadge(tk.Canvas):
+    """Stats badge drawn on one canvas"""
+    def __init__(self, parent, icon, value, label=""):
+        super().__init__(parent, bg=ACCENT_YELLOW, highlightthickness=0, bd=0)
+        
+        scaling = _widget_scaling(self)
+        self.icon_font = tkfont.Font(family="Pixelify Sans", size=_px(20, scaling))
+        self.value_font = tkfont.Font(family="Pixelify Sans", size=_px(16, scaling), weight="bold")
+        self.label_font = tkfont.Font(family="Poppins", size=_px(10, scaling))
+        self.row_height = round(28 * scaling)
+        
+        # Yellow border (2px), pixel border (2px), then the card background
+        self._frame = self.create_rectangle(0, 0, 0, 0, fill=PIXEL_BORDER, width=0)
+        self._content = self.create_rectangle(0, 0, 0, 0, fill=CARD_BG, width=0)
+        self._icon = self.create_text(0, 0, text=icon, font=self.icon_font, fill=ACCENT_YELLOW, anchor="w")
+        self._value = self.create_text(0, 0, text=str(value), font=self.value_font, fill=TEXT, anchor="n")
+        self._label = self.create_text(0, 0, text=label, font=self.label_font, fill=SUBTEXT, anchor="n")
+        self.label = label
+        self._layout()
+    
+    def _layout(self):
+        inset = 4
+        icon_w = self.icon_font.measure(self.itemcget(self._icon, "text"))
+        value_w = self.value_font.measure(self.itemcget(self._value, "text"))
+        label_w = self.label_font.measure(self.label) if self.label else 0
+        # Rows as tall as a default CTkLabel (28px, scaled), like PixelBadge
+        value_h = max(self.row_height, self.value_font.metrics("linespace"))
+        label_h = max(self.row_height, self.label_font.metrics("linespace")) if self.label else 0
+        
+        text_w = max(value_w, label_w)
+        width = inset + 8 + icon_w + 8 + text_w + 8 + inset
+        height = inset + max(self.icon_font.metrics("linespace") + 12, value_h + label_h) + inset
+        
+        self.configure(width=width, height=height)
+        self.coords(self._frame, 2, 2, width - 2, height - 2)
+        self.coords(self._content, inset, inset, width - inset, height - inset)
+        self.coords(self._icon, inset + 8, height / 2)
+        
+        text_x = inset + 8 + icon_w + 8 + text_w / 2
+        text_top = (height - value_h - label_h) / 2
+        self.coords(self._value, text_x, text_top)
+        self.coords(self._label, text_x, text_top + value_h)
+    
+    def set_value(self, value):
+        """Update the displayed value"""
+        self.itemconfigure(self._value, text=str(value))
+        self._layout()
+
+
+class CanvasProgressBar(tk.Canvas):
+    """Retro progress bar drawn on one canvas"""
+    def __init__(self, parent, max_value=100):
+        super().__init__(
+            parent,
+            bg=INPUT_BG,
+            highlightthickness=2,
+            highlightbackground=PIXEL_BORDER,
+            highlightcolor=PIXEL_BORDER,
+            bd=0,
+            height=20
+        )
+        
+        self.max_value = max_value
+        self.current_value = 0
+        self._fill = self.create_rectangle(0, 0, 0, 20, fill=ACCENT_GREEN, width=0)
+        self.bind("<Configure>", lambda e: self._redraw())
+        
+    def set_value(self, value):
+        """Update progress bar value"""
+        self.current_value = min(value, self.max_value)
+        self._redraw()
+    
+    def _redraw(self):
+        width = int((self.current_value / self.max_value) * self.winfo_width())
+        self.coords(self._fill, 0, 0, width, self.winfo_height())
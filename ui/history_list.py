@@ -0,0 +1,173 @@
+import tkinter as tk
+from collections import OrderedDict
+
+import customtkinter as ctk
+from ui.theme import *
+from ui.components import PixelLabel
+
+
+class DayRow(ctk.CTkFrame):
+    """One recyclable quest log entry"""
+    def __init__(self, parent, height, font):
+        super().__init__(
+            parent,
+            fg_color=CARD_BG,
+            corner_radius=0,
+            border_width=2,
+            border_color=PIXEL_BORDER,
+            height=height
+        )
+        self.pack_propagate(False)
+        self.index = None
+
+        content = ctk.CTkFrame(self, fg_color="transparent")
+        content.pack(padx=15, pady=15, fill="x")
+
+        self.title = PixelLabel(content, "", style="title")
+        self.title.pack(anchor="w")
+
+        self.info = ctk.CTkLabel(
+            content,
+            text="",
+            justify="left",
+            text_color=TEXT,
+            font=font
+        )
+        self.info.pack(anchor="w", pady=(10, 0))
+
+    def show(self, index, title, text):
+        self.index = index
+        self.title.configure(text=title)
+        self.info.configure(text=text)
+
+
+class VirtualList(ctk.CTkFrame):
+    """Scrollable list that only builds widgets for the rows on screen.
+
+    Rows have a fixed height, so the scroll region is known without
+    touching the data. While scrolling, the same handful of ``DayRow``
+    widgets is moved around and refilled; entries are fetched a page at
+    a time through ``fetch(offset, limit)`` and only a few pages are kept.
+    """
+    def __init__(self, parent, count, fetch, render, font,
+                 row_height=150, gap=16, page_size=50, max_pages=8):
+        super().__init__(parent, fg_color=BG, corner_radius=0)
+
+        self.count = count
+        self.fetch = fetch
+        self.render = render  # (index, entry) -> (title, text)
+        self.font = font
+        self.row_height = row_height
+        self.gap = gap
+        self.page_size = page_size
+        self.max_pages = max_pages
+
+        self._pages = OrderedDict()
+        self._rows = []  # pool of (DayRow, canvas window id)
+
+        self.canvas = tk.Canvas(
+            self,
+            bg=BG,
+            highlightthickness=0,
+            bd=0,
+            yscrollincrement=row_height // 5
+        )
+        self.scrollbar = ctk.CTkScrollbar(
+            self,
+            command=self._on_scrollbar,
+            button_color=PIXEL_BORDER,
+            button_hover_color=ACCENT
+        )
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+
+        self.canvas.bind("<Configure>", lambda e: self._layout())
+
+        # Wheel events land on whatever row is under the cursor; the
+        # toplevel binding sees all of them
+        top = self.winfo_toplevel()
+        top.bind("<MouseWheel>", self._on_wheel, add="+")
+        top.bind("<Button-4>", lambda e: self._scroll(-1), add="+")
+        top.bind("<Button-5>", lambda e: self._scroll(1), add="+")
+
+    # ================= DATA =================
+    def entry(self, index):
+        page = index // self.page_size
+        if page in self._pages:
+            self._pages.move_to_end(page)
+        else:
+            self._pages[page] = self.fetch(page * self.page_size, self.page_size)
+            if len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        rows = self._pages[page]
+        offset = index - page * self.page_size
+        return rows[offset] if offset < len(rows) else None
+
+    def set_count(self, count):
+        """Grow the list (e.g. after a new day was saved).
+
+        Rows already on screen keep their content; only the last cached
+        page, which may have been fetched short, is dropped.
+        """
+        self._pages.pop(self.count // self.page_size, None)
+        self.count = count
+        self._layout()
+
+    # ================= SCROLLING =================
+    def _on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self._render()
+
+    def _on_wheel(self, event):
+        delta = event.delta
+        if abs(delta) >= 120:  # Windows reports multiples of 120
+            delta //= 120
+        self._scroll(-delta)
+
+    def _scroll(self, units):
+        self.canvas.yview_scroll(units, "units")
+        self._render()
+
+    # ================= RENDERING =================
+    def _layout(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        total = self.count * self.row_height
+        self.canvas.configure(scrollregion=(0, 0, width, max(total, height)))
+
+        # Enough rows to cover the viewport plus one partially visible
+        needed = min(self.count, height // self.row_height + 2)
+        while len(self._rows) < needed:
+            row = DayRow(self.canvas, self.row_height - self.gap, self.font)
+            window = self.canvas.create_window(0, 0, window=row, anchor="nw")
+            self._rows.append((row, window))
+
+        for _, window in self._rows:
+            self.canvas.itemconfigure(window, width=width)
+        self._render()
+
+    def _render(self):
+        if not self._rows:
+            return
+        top = int(self.canvas.canvasy(0))
+        first = max(0, top // self.row_height)
+        visible = range(first, min(first + len(self._rows), self.count))
+
+        # Each index always maps to the same pooled row, so scrolling by
+        # one row refills a single widget instead of all of them
+        used = set()
+        for index in visible:
+            slot = index % len(self._rows)
+            row, window = self._rows[slot]
+            used.add(slot)
+            self.canvas.coords(window, 0, index * self.row_height + self.gap // 2)
+            self.canvas.itemconfigure(window, state="normal")
+            if row.index != index:
+                entry = self.entry(index)
+                if entry is not None:
+                    row.show(index, *self.render(index, entry))
+
+        for slot, (_, window) in enumerate(self._rows):
+            if slot not in used:
+                self.canvas.itemconfigure(window, state="hidden")
@@ -0,0 +1,227 @@
+import json
+import os
+import platform
+import sys
+import time
+import tkinter
+from collections import deque
+from datetime import datetime
+
+import customtkinter as ctk
+from ui.theme import *
+
+
+ENV_FLAG = "PETAL_TRACE_LATENCY"
+CLI_FLAG = "--trace-latency"
+TRACE_DIR = "data/traces"
+
+# Histogram bucket upper bounds in ms; the last bucket is open-ended
+BUCKETS = (1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000)
+
+
+def percentile(samples, p):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+def callback_name(fn):
+    name = getattr(fn, "__qualname__", None) or repr(fn)
+    code = getattr(fn, "__code__", None)
+    if "<lambda>" in name and code is not None:
+        name = f"{name}:{code.co_firstlineno}"
+    return name
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        i = 0
+        while i < len(BUCKETS) and ms > BUCKETS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def quantile(self, p):
+        """Upper bound of the bucket holding the p-th percentile."""
+        target = self.count * p / 100
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= target:
+                return BUCKETS[i] if i < len(BUCKETS) else self.max
+        return 0.0
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 2),
+            "mean_ms": round(self.total / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max, 2),
+            "p50_ms": self.quantile(50),
+            "p99_ms": self.quantile(99),
+            "buckets": dict(zip([f"<={b}" for b in BUCKETS] + ["more"], self.counts)),
+        }
+
+
+class LatencyMonitor:
+    """Opt-in tracing of how long Tk callbacks hold the main thread.
+
+    ``install`` wraps every ``after``/``after_idle`` callback and every
+    bound event handler, and the tick scheduler reports each task it
+    runs. Durations are self time: a scheduler task is not counted again
+    in the ``after`` callback that ran it. Lag is how late a timed
+    ``after`` callback fired. Callbacks over ``slow_ms`` are logged.
+
+    Enabled with ``PETAL_TRACE_LATENCY=1`` or ``--trace-latency``; when
+    disabled nothing is patched and the app runs untouched.
+    """
+
+    def __init__(self, enabled=None, slow_ms=50):
+        if enabled is None:
+            enabled = os.environ.get(ENV_FLAG) == "1" or CLI_FLAG in sys.argv
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.started = time.time()
+        self.handlers = {}              # name -> Histogram
+        self.lag = deque(maxlen=2000)   # ms, most recent samples
+        self.lag_hist = Histogram()
+        self.slow = deque(maxlen=200)   # (seconds since start, name, ms)
+        self._stack = []                # child time of each running callback
+        self._overlay = None
+
+    # ================= INSTRUMENTATION =================
+    def install(self):
+        if not self.enabled:
+            return
+        monitor = self
+        original_after = tkinter.Misc.after
+        original_bind = tkinter.Misc._bind
+
+        def after(widget, ms, func=None, *args):
+            if func is None:
+                return original_after(widget, ms)
+            name = "after " + callback_name(func)
+            due = time.perf_counter() + ms / 1000 if isinstance(ms, int) else None
+
+            def traced(*a):
+                if due is not None:
+                    monitor.record_lag((time.perf_counter() - due) * 1000)
+                return monitor.call(name, func, *a)
+            return original_after(widget, ms, traced, *args)
+
+        def _bind(widget, what, sequence, func, add, needcleanup=1):
+            if callable(func):
+                name = f"bind {sequence} " + callback_name(func)
+                inner = func
+                func = lambda *a: monitor.call(name, inner, *a)
+            return original_bind(widget, what, sequence, func, add, needcleanup)
+
+        tkinter.Misc.after = after
+        tkinter.Misc._bind = _bind
+        print(f"[LATENCY] tracing on, logging callbacks over {self.slow_ms} ms")
+
+    def call(self, name, fn, *args):
+        self._stack.append(0.0)
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            total = (time.perf_counter() - t0) * 1000
+            own = total - self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            self.record(name, own)
+
+    def task(self, key, fn):
+        """Tick scheduler hook: run one scheduled task under its key's name."""
+        if isinstance(key, tuple):
+            key = key[0]  # e.g. ("toast", id): one histogram for all toasts
+        label = key if isinstance(key, str) else callback_name(fn)
+        return self.call(f"task {label}", fn)
+
+    def record(self, name, ms):
+        hist = self.handlers.get(name)
+        if hist is None:
+            hist = self.handlers[name] = Histogram()
+        hist.add(ms)
+        if ms >= self.slow_ms:
+            self.slow.append((round(time.time() - self.started, 3), name, round(ms, 2)))
+            print(f"[SLOW CALLBACK] {name} {ms:.1f} ms")
+
+    def record_lag(self, ms):
+        ms = max(0.0, ms)
+        self.lag.append(ms)
+        self.lag_hist.add(ms)
+
+    # ================= OVERLAY =================
+    def attach_overlay(self, root, scheduler, font, key="<F12>"):
+        """Small live readout in the window corner; ``key`` toggles it."""
+        if not self.enabled:
+            return
+        self._overlay = ctk.CTkLabel(root, text="", font=font, fg_color=CARD_BG, text_color=SUBTEXT)
+        self._overlay_scheduler = scheduler
+        root.bind(key, lambda e: self._toggle_overlay(), add="+")
+        self._toggle_overlay()
+
+    def _toggle_overlay(self):
+        if self._overlay.winfo_ismapped():
+            self._overlay.place_forget()
+            self._overlay_scheduler.cancel("latency-overlay")
+        else:
+            self._overlay.place(relx=1.0, x=-8, y=8, anchor="ne")
+            self._overlay.lift()
+            self._refresh_overlay()
+
+    def _refresh_overlay(self):
+        lag = list(self.lag)
+        worst = max(self.handlers.items(), key=lambda item: item[1].max, default=None)
+        text = f" lag p50 {percentile(lag, 50):.0f} / p99 {percentile(lag, 99):.0f} ms "
+        if worst:
+            text += f"\n worst {worst[0][-28:]} {worst[1].max:.0f} ms "
+        self._overlay.configure(text=text)
+        self._overlay_scheduler.call_later(500, self._refresh_overlay, key="latency-overlay")
+
+    # ================= EXPORT =================
+    def summary(self):
+        lag = list(self.lag)
+        return {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "duration_s": round(time.time() - self.started, 1),
+            "python": platform.python_version(),
+            "tk": str(tkinter.TkVersion),
+            "platform": platform.platform(),
+            "slow_ms": self.slow_ms,
+            "lag": dict(self.lag_hist.to_dict(), p50_ms=percentile(lag, 50), p99_ms=percentile(lag, 99)),
+            "handlers": {
+                name: hist.to_dict()
+                for name, hist in sorted(self.handlers.items(), key=lambda item: -item[1].total)
+            },
+            "slow": [{"t": t, "name": name, "ms": ms} for t, name, ms in self.slow],
+        }
+
+    def export(self, diagnostics=(), directory=TRACE_DIR):
+        """Write the trace as JSON; returns the path (None when disabled).
+
+        ``diagnostics`` are extra report lines stored with the trace.
+        """
+        if not self.enabled:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, datetime.now().strftime("latency-%Y%m%d-%H%M%S.json"))
+        trace = self.summary()
+        trace["diagnostics"] = list(diagnostics)
+        with open(path, "w") as f:
+            json.dump(trace, f, indent=2)
+        print(f"[LATENCY] trace written to {path}")
+        return path
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+
+import customtkinter as ctk
+from PIL import Image, ImageDraw, ImageFont
+from ui.theme import *
+
+
+class PixelTextRenderer:
+    """Renders pixel-font text (with drop shadow) into cached CTkImages.
+
+    Font objects are kept per size, text metrics per (text, size) and
+    rendered images in a bounded LRU keyed by (text, size, color), so
+    redrawing the same heading, timer value or badge number is a dict
+    lookup instead of a font load plus two draws.
+    """
+    def __init__(self, font_path, max_images=256, max_metrics=1024):
+        self.font_path = font_path
+        self.max_images = max_images
+        self.max_metrics = max_metrics
+        self._fonts = {}
+        self._metrics = OrderedDict()
+        self._images = OrderedDict()
+
+    def font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = ImageFont.truetype(self.font_path, size)
+        return font
+
+    def measure(self, text, size):
+        """(width, height) of ``text`` as drawn at the origin."""
+        key = (text, size)
+        metrics = self._metrics.get(key)
+        if metrics is not None:
+            self._metrics.move_to_end(key)
+            return metrics
+
+        bbox = self.font(size).getbbox(text)
+        metrics = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+        self._metrics[key] = metrics
+        if len(self._metrics) > self.max_metrics:
+            self._metrics.popitem(last=False)
+        return metrics
+
+    def render(self, text, size, color=TITLE_GLOW):
+        """Cached CTkImage of ``text``."""
+        key = (text, size, color)
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            return image
+
+        font = self.font(size)
+        w, h = self.measure(text, size)
+
+        img = Image.new("RGBA", (w + 10, h + 10), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+
+        # Pixel glow effect
+        draw.text((5, 5), text, font=font, fill=SHADOW_COLOR)  # Shadow
+        draw.text((3, 3), text, font=font, fill=color)  # Main text
+
+        image = ctk.CTkImage(img, size=(w + 4, h + 4))
+        self._images[key] = image
+        if len(self._images) > self.max_images:
+            self._images.popitem(last=False)
+        return image
+
+    def cache_info(self):
+        return {
+            "fonts": len(self._fonts),
+            "metrics": len(self._metrics),
+            "images": len(self._images),
+        }
@@ -0,0 +1,190 @@
+import itertools
+import time
+import tkinter
+from collections import deque
+
+
+class WakeupCounter:
+    """Counts every Tk ``after`` callback that fires, whoever scheduled it.
+
+    The tick scheduler only sees its own wakeups; CustomTkinter's
+    appearance and DPI polling loops run on plain ``after`` calls.
+    ``install`` wraps ``tkinter.Misc.after`` (and so ``after_idle``)
+    and must run before the first widget exists.
+    """
+
+    def __init__(self):
+        self._times = deque()
+        self.total = 0
+
+    def install(self):
+        counter = self
+        original_after = tkinter.Misc.after
+
+        def after(widget, ms, func=None, *args):
+            if func is None:
+                return original_after(widget, ms)
+
+            def counted(*a):
+                counter.hit()
+                return func(*a)
+            return original_after(widget, ms, counted, *args)
+
+        tkinter.Misc.after = after
+
+    def hit(self):
+        self._times.append(time.monotonic())
+        self.total += 1
+
+    def per_minute(self):
+        cutoff = time.monotonic() - 60
+        while self._times and self._times[0] < cutoff:
+            self._times.popleft()
+        return len(self._times)
+
+
+class TickScheduler:
+    """Single owner of all timed UI work on the Tk event loop.
+
+    Callbacks are kept in one table and only the earliest one has a Tk
+    ``after`` pending, so there is at most one timer in the event loop.
+    When the table is empty nothing is pending and the loop sleeps until
+    the next user event.
+
+    ``throttle=True`` callbacks are deferred while the window is
+    unfocused (at least ``UNFOCUSED_MIN`` ms) or minimized (at least
+    ``HIDDEN_MIN`` ms), but never past their ``latest`` deadline.
+    """
+
+    UNFOCUSED_MIN = 250
+    HIDDEN_MIN = 10000
+
+    def __init__(self, root):
+        self.root = root
+        self.mode = "active"  # "active", "unfocused" or "hidden"
+        self._tasks = {}      # key -> (due, created, latest, fn, throttle)
+        self._after_id = None
+        self._armed_for = None
+        self._ids = itertools.count()
+        self._wakeups = deque()
+        self.total_wakeups = 0
+        self.tracer = None    # LatencyMonitor, when latency tracing is on
+        self.counter = None   # WakeupCounter, when diagnostics are on
+
+        root.bind("<Map>", self._on_map, add="+")
+        root.bind("<Unmap>", self._on_unmap, add="+")
+        root.bind("<FocusIn>", lambda e: self.root.after_idle(self._check_focus), add="+")
+        root.bind("<FocusOut>", lambda e: self.root.after_idle(self._check_focus), add="+")
+
+    # ================= API =================
+    def call_later(self, delay_ms, fn, key=None, throttle=False, latest_ms=None):
+        """Run ``fn`` once after ``delay_ms``; a new call with the same key replaces the old one."""
+        if key is None:
+            key = next(self._ids)
+        now = time.monotonic()
+        latest = now + latest_ms / 1000 if latest_ms is not None else None
+        self._tasks[key] = (now + delay_ms / 1000, now, latest, fn, throttle)
+        self._arm()
+        return key
+
+    def cancel(self, key):
+        if self._tasks.pop(key, None) is not None:
+            self._arm()
+
+    def pending(self, key):
+        return key in self._tasks
+
+    @property
+    def idle(self):
+        return not self._tasks
+
+    def wakeups_per_minute(self):
+        cutoff = time.monotonic() - 60
+        while self._wakeups and self._wakeups[0] < cutoff:
+            self._wakeups.popleft()
+        return len(self._wakeups)
+
+    def report(self):
+        ours = (
+            f"{self.wakeups_per_minute()} from the tick scheduler in the last minute, "
+            f"{self.total_wakeups} total, {len(self._tasks)} pending"
+        )
+        if self.counter is None:
+            return f"[SCHEDULER] {ours} (other Tk after callbacks not counted)"
+        return (
+            f"[SCHEDULER] {self.counter.per_minute()} Tk wakeups in the last minute, "
+            f"{self.counter.total} total; {ours}"
+        )
+
+    # ================= INTERNALS =================
+    def _due(self, task):
+        due, created, latest, _, throttle = task
+        if throttle and self.mode != "active":
+            floor = self.HIDDEN_MIN if self.mode == "hidden" else self.UNFOCUSED_MIN
+            due = max(due, created + floor / 1000)
+            if latest is not None:
+                due = min(due, latest)
+        return due
+
+    def _arm(self):
+        if not self._tasks:
+            if self._after_id:
+                self.root.after_cancel(self._after_id)
+                self._after_id = self._armed_for = None
+            return
+
+        due = min(self._due(task) for task in self._tasks.values())
+        if self._after_id and self._armed_for is not None and abs(self._armed_for - due) < 0.001:
+            return
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+        delay = max(0, int((due - time.monotonic()) * 1000 + 0.5))
+        self._armed_for = due
+        self._after_id = self.root.after(delay, self._fire)
+
+    def _fire(self):
+        self._after_id = self._armed_for = None
+        now = time.monotonic()
+        self._wakeups.append(now)
+        self.total_wakeups += 1
+
+        due = [key for key, task in self._tasks.items() if self._due(task) <= now + 0.001]
+        for key in due:
+            # An earlier callback may have cancelled or rescheduled this one
+            task = self._tasks.get(key)
+            if task is None or self._due(task) > now + 0.001:
+                continue
+            del self._tasks[key]
+            try:
+                if self.tracer:
+                    self.tracer.task(key, task[3])
+                else:
+                    task[3]()
+            except Exception as e:
+                print(f"[SCHEDULED CALLBACK FAILED] {getattr(task[3], '__qualname__', task[3])} -> {e}")
+        self._arm()
+
+    def _set_mode(self, mode):
+        if mode != self.mode:
+            self.mode = mode
+            if self._after_id:
+                self.root.after_cancel(self._after_id)
+                self._after_id = self._armed_for = None
+            self._arm()
+
+    def _on_map(self, event):
+        if event.widget is self.root:
+            self._check_focus()
+
+    def _on_unmap(self, event):
+        if event.widget is self.root:
+            self._set_mode("hidden")
+
+    def _check_focus(self):
+        if self.mode == "hidden" and self.root.state() == "iconic":
+            return
+        try:
+            focused = self.root.focus_get() is not None
+        except KeyError:
+            focused = True  # focus is on a Tk-internal widget
+        self._set_mode("active" if focused else "unfocused")
@@ -0,0 +1,79 @@
+import tkinter as tk
+
+from ui.theme import *
+
+
+class StagedBuilder:
+    """Builds below-the-fold sections after the first paint.
+
+    ``defer`` packs a fixed-height placeholder right away, so the scroll
+    height is about right from the start. ``start`` then builds one
+    section per scheduler slice, letting Tk handle input in between;
+    scrolling near a placeholder builds it on the spot.
+    """
+    def __init__(self, root, scheduler, parent):
+        self.root = root
+        self.scheduler = scheduler
+        self.parent = parent
+        self._pending = []  # (name, build, placeholder) in display order
+        self._built = set()
+        self._on_done = None
+
+    def defer(self, name, build, height):
+        """``build(parent)`` is called later with the placeholder as parent."""
+        placeholder = tk.Frame(self.parent, bg=BG, height=height, bd=0, highlightthickness=0)
+        placeholder.pack(fill="x")
+        placeholder.pack_propagate(False)
+        self._pending.append((name, build, placeholder))
+
+    def built(self, name):
+        return name in self._built
+
+    def only_if_built(self, name, fn):
+        """Wrap a refresh callback so it skips sections that don't exist yet."""
+        def call():
+            if name in self._built:
+                fn()
+        return call
+
+    def start(self, on_done=None):
+        self._on_done = on_done
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind(sequence, lambda e: self._build_near_view(), add="+")
+        self._schedule()
+
+    def ensure(self, name=None):
+        """Build ``name`` (or everything left) immediately."""
+        for entry in list(self._pending):
+            if name is None or entry[0] == name:
+                self._build(entry)
+
+    # ================= INTERNALS =================
+    def _schedule(self):
+        if self._pending:
+            self.scheduler.call_later(0, self._next, key="staged-build")
+        elif self._on_done:
+            done, self._on_done = self._on_done, None
+            done()
+
+    def _next(self):
+        if self._pending:
+            self._build(self._pending[0])
+        self._schedule()
+
+    def _build(self, entry):
+        name, build, placeholder = entry
+        self._pending.remove(entry)
+        build(placeholder)
+        # From now on the section decides its own height
+        placeholder.pack_propagate(True)
+        self._built.add(name)
+        if not self._pending:
+            self._schedule()
+
+    def _build_near_view(self):
+        # Anything starting within a screen below the window gets built now
+        limit = self.root.winfo_rooty() + self.root.winfo_height() * 2
+        for entry in list(self._pending):
+            if entry[2].winfo_rooty() < limit:
+                self._build(entry)
@@ -0,0 +1,91 @@
+import heapq
+import itertools
+
+import customtkinter as ctk
+from ui.theme import *
+
+
+class Toast(ctk.CTkFrame):
+    """Reusable pixel-style toast"""
+    def __init__(self, parent, font):
+        super().__init__(
+            parent,
+            fg_color=PIXEL_BORDER,
+            corner_radius=0,
+            border_width=3,
+            border_color=ACCENT
+        )
+        inner = ctk.CTkFrame(self, fg_color=CARD_BG, corner_radius=0)
+        inner.pack(padx=3, pady=3)
+
+        self.label = ctk.CTkLabel(inner, text="", font=font, text_color=ACCENT)
+        self.label.pack(padx=25, pady=12)
+        self.message = None
+
+    def show(self, text, color):
+        if self.message != (text, color):
+            self.configure(border_color=color)
+            self.label.configure(text=text, text_color=color)
+            self.message = (text, color)
+
+
+class ToastService:
+    """Queued toast notifications on a small pool of reusable widgets.
+
+    At most ``max_live`` toasts are on screen, stacked upwards from the
+    bottom instead of overlapping; more messages wait in a priority queue.
+    A message identical to one that is showing or queued is collapsed
+    into it (a showing toast just stays up longer). The pool never grows
+    beyond ``max_live`` widgets.
+    """
+
+    SPACING = 0.075  # relative height between stacked toasts
+
+    def __init__(self, root, scheduler, font, max_live=2, duration_ms=2000):
+        self.root = root
+        self.scheduler = scheduler
+        self.font = font
+        self.max_live = max_live
+        self.duration_ms = duration_ms
+        self._pool = []
+        self._live = []   # Toast widgets, bottom first
+        self._queue = []  # heap of (-priority, seq, text, color)
+        self._seq = itertools.count()
+
+    def show(self, text, color=ACCENT, priority=0):
+        message = (text, color)
+        for toast in self._live:
+            if toast.message == message:
+                self._schedule_dismiss(toast)
+                return
+        if any((t, c) == message for _, _, t, c in self._queue):
+            return
+
+        heapq.heappush(self._queue, (-priority, next(self._seq), text, color))
+        self._drain()
+
+    def _drain(self):
+        while self._queue and len(self._live) < self.max_live:
+            _, _, text, color = heapq.heappop(self._queue)
+            toast = self._pool.pop() if self._pool else Toast(self.root, self.font)
+            toast.show(text, color)
+            self._live.append(toast)
+            self._schedule_dismiss(toast)
+        self._restack()
+
+    def _schedule_dismiss(self, toast):
+        self.scheduler.call_later(
+            self.duration_ms, lambda: self._dismiss(toast), key=("toast", id(toast))
+        )
+
+    def _dismiss(self, toast):
+        if toast in self._live:
+            self._live.remove(toast)
+            toast.place_forget()
+            self._pool.append(toast)
+        self._drain()
+
+    def _restack(self):
+        for slot, toast in enumerate(self._live):
+            toast.place(relx=0.5, rely=0.92 - slot * self.SPACING, anchor="center")
+            toast.lift()
@@ -0,0 +1,40 @@
+class WindowManager:
+    """Keeps at most one Toplevel per window type.
+
+    ``show`` builds the window on first use; later calls only run its
+    ``update`` callback and raise the existing window, so repeated clicks
+    never stack duplicates.
+    """
+    def __init__(self):
+        self._windows = {}  # key -> (window, update)
+
+    def get(self, key):
+        entry = self._windows.get(key)
+        if entry and entry[0].winfo_exists():
+            return entry[0]
+        self._windows.pop(key, None)
+        return None
+
+    def show(self, key, build, update, *args):
+        win = self.get(key)
+        if win is None:
+            win = build()
+            self._windows[key] = (win, update)
+            win.bind("<Destroy>", lambda e, w=win: self._forget(key, e, w), add="+")
+
+        update(win, *args)
+        win.deiconify()
+        win.lift()
+        win.focus()
+        return win
+
+    def refresh(self, key, *args):
+        """Re-run the update of an open window (no-op if it is closed)."""
+        win = self.get(key)
+        if win is not None:
+            self._windows[key][1](win, *args)
+
+    def _forget(self, key, event, win):
+        # <Destroy> also fires for every child widget
+        if event.widget is win and self._windows.get(key, (None,))[0] is win:
+            del self._windows[key]